@@ -1,49 +1,213 @@
+from __future__ import annotations
+
 import os
-from dataclasses import dataclass
-from typing import Optional
-from dotenv import load_dotenv
+import sys
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
 
-# Load environment variables from .env file
-load_dotenv()
+# slots=True needs Python 3.10+; older interpreters fall back to a regular __dict__
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class SlackConfig:
     """Configuration for Slack migration"""
     source_token: str
     dest_token: str
-    source_user_token: Optional[str]  # User token for operations requiring user permissions
-    source_workspace_name: Optional[str] = None
-    dest_workspace_name: Optional[str] = None
+    source_user_token: str | None  # User token for operations requiring user permissions
+    source_workspace_name: str | None = None
+    dest_workspace_name: str | None = None
     batch_size: int = 100
     rate_limit_delay: float = 1.0
     max_retries: int = 3
+    max_concurrent_file_downloads: int = 4  # Files fetched in parallel per channel
+    file_rate_per_sec: float = 2.0  # Sustained file downloads per second
+    file_burst: int = 4  # File downloads allowed back to back before throttling
     output_dir: str = "migration_data"
     log_level: str = "INFO"
+    log_level_no: int = field(init=False, repr=False)  # Numeric form of log_level
+
+    def __post_init__(self):
+        # Resolve the level name once so logging setup does not have to look it up again
+        import logging
+        level_no = logging.getLevelName(self.log_level.upper())
+        object.__setattr__(self, "log_level_no", level_no if isinstance(level_no, int) else logging.INFO)
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] = os.environ, require_tokens: bool = True) -> SlackConfig:
+        """Build a config from environment variables, reporting all missing or invalid values at once
+
+        Args:
+            env: Mapping to read variables from
+            require_tokens: Whether missing Slack tokens are an error. Local-only commands
+                          (e.g. inspecting downloaded data) pass False and get empty tokens.
+        """
+        getenv = env.get
+        values = {}
+        errors = []
+
+        # Required tokens (unset and empty both count as missing)
+        if require_tokens:
+            missing = REQUIRED_KEYS.difference(name for name in REQUIRED_KEYS if getenv(name))
+            for env_name in sorted(missing):
+                errors.append(f"{env_name} environment variable is required")
+
+        # One pass over the spec table; defaults are already parsed, so only set values are converted
+        for field_name, (env_name, caster, default) in _FIELD_SPEC.items():
+            raw_value = getenv(env_name)
+            if raw_value is None:
+                values[field_name] = default
+            elif caster is None:
+                values[field_name] = raw_value
+            else:
+                try:
+                    values[field_name] = caster(raw_value)
+                except ValueError:
+                    errors.append(f"{env_name}={raw_value!r} is not a valid {caster.__name__}")
+
+        if errors:
+            raise ValueError("; ".join(errors))
+
+        return cls(**values)
 
-def get_config() -> SlackConfig:
-    """Get configuration from environment variables"""
-
-    # Required tokens
-    source_token = os.getenv("SOURCE_SLACK_TOKEN")
-    dest_token = os.getenv("DEST_SLACK_TOKEN")
-
-    if not source_token:
-        raise ValueError("SOURCE_SLACK_TOKEN environment variable is required")
-    if not dest_token:
-        raise ValueError("DEST_SLACK_TOKEN environment variable is required")
-
-    # Optional user token for operations requiring user permissions (like unarchiving)
-    source_user_token = os.getenv("SOURCE_USER_TOKEN")
-
-    return SlackConfig(
-        source_token=source_token,
-        dest_token=dest_token,
-        source_user_token=source_user_token,
-        source_workspace_name=os.getenv("SOURCE_WORKSPACE_NAME"),
-        dest_workspace_name=os.getenv("DEST_WORKSPACE_NAME"),
-        batch_size=int(os.getenv("BATCH_SIZE", "100")),
-        rate_limit_delay=float(os.getenv("RATE_LIMIT_DELAY", "1.0")),
-        max_retries=int(os.getenv("MAX_RETRIES", "3")),
-        output_dir=os.getenv("OUTPUT_DIR", "migration_data"),
-        log_level=os.getenv("LOG_LEVEL", "INFO")
+# Fields whose environment variable is not simply the upper-cased field name
+ENV_ALIASES = {
+    "source_token": "SOURCE_SLACK_TOKEN",
+    "dest_token": "DEST_SLACK_TOKEN",
+}
+
+def env_name_for(field_name: str) -> str:
+    """Get the environment variable name for a SlackConfig field"""
+    return ENV_ALIASES.get(field_name) or field_name.upper()
+
+# Environment variables that must be set to a non-empty value
+REQUIRED_KEYS = frozenset({"SOURCE_SLACK_TOKEN", "DEST_SLACK_TOKEN"})
+
+def _intern_upper(value: str) -> str:
+    """Upper-case and intern a setting such as LOG_LEVEL"""
+    return sys.intern(value.upper())
+
+# SlackConfig field -> (environment variable, converter or None for raw strings, default).
+# Low-cardinality strings are interned; tokens are not (they would stay in the intern table).
+# Read-only so the table can be shared safely by every from_env() call.
+_FIELD_SPEC = MappingProxyType({
+    field_name: (env_name_for(field_name), caster, default)
+    for field_name, caster, default in (
+        ("source_token", None, ""),
+        ("dest_token", None, ""),
+        # User token for operations requiring user permissions (like unarchiving)
+        ("source_user_token", None, None),
+        ("source_workspace_name", None, None),
+        ("dest_workspace_name", None, None),
+        ("batch_size", int, 100),
+        ("rate_limit_delay", float, 1.0),
+        ("max_retries", int, 3),
+        ("max_concurrent_file_downloads", int, 4),
+        ("file_rate_per_sec", float, 2.0),
+        ("file_burst", int, 4),
+        ("output_dir", sys.intern, "migration_data"),
+        ("log_level", _intern_upper, "INFO"),
     )
+})
+
+# Snapshot of os.environ that get_config() reads from (see refresh_env)
+_ENV: dict[str, str] = dict(os.environ)
+
+def refresh_env():
+    """Re-snapshot os.environ and drop the cached config so the next get_config() sees changes"""
+    global _ENV
+    _ENV = dict(os.environ)
+    _get_config.cache_clear()
+    globals().pop("settings", None)
+
+def _find_dotenv() -> Path | None:
+    """Find .env the same way python-dotenv does: from this module's directory upwards"""
+    here = Path(__file__).resolve().parent
+    for directory in (here, *here.parents):
+        candidate = directory / ".env"
+        if candidate.is_file():
+            return candidate
+    return None
+
+def _read_dotenv_values(env_file: Path) -> dict[str, str]:
+    """Parse .env, reusing a JSON sidecar cache while the file is unchanged
+
+    The cache is keyed by the .env modification time and size. It holds the same
+    secrets as .env itself, so it is written with owner-only permissions. Files that
+    use ${VAR} interpolation are never cached, since the result also depends on the
+    environment the values are expanded against.
+    """
+    stat = env_file.stat()
+    cache_file = env_file.with_name(env_file.name + ".cache.json")
+
+    try:
+        with open(cache_file, "r") as f:
+            cached = json.load(f)
+        if cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+            return cached["values"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    # Imported here so commands that never read the config skip the import cost
+    from dotenv import dotenv_values
+
+    values = {key: value for key, value in dotenv_values(env_file, interpolate=False).items() if value is not None}
+    if any("${" in value for value in values.values()):
+        return {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+
+    try:
+        fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "values": values}, f)
+    except OSError:
+        pass  # The cache is only an optimization
+
+    return values
+
+def _load_dotenv():
+    """Load environment variables from .env file (only once per process tree)"""
+    if os.getenv("_DOTENV_LOADED"):
+        return
+
+    env_file = _find_dotenv()
+    if env_file:
+        # Like load_dotenv(): variables already set in the environment win
+        for key, value in _read_dotenv_values(env_file).items():
+            os.environ.setdefault(key, value)
+
+    os.environ["_DOTENV_LOADED"] = "1"
+    refresh_env()
+
+def get_config(require_tokens: bool = True) -> SlackConfig:
+    """Get configuration from environment variables
+
+    The result is cached, so every caller shares the same SlackConfig instance.
+    Call refresh_env() after changing os.environ to re-read it.
+
+    Args:
+        require_tokens: Whether to fail when the Slack tokens are not set. Commands
+                      that never talk to Slack can pass False.
+    """
+    # Normalized and passed positionally: lru_cache keys get_config(), get_config(True)
+    # and get_config(require_tokens=True) differently, which would build separate instances
+    return _get_config(bool(require_tokens))
+
+@lru_cache(maxsize=2)  # One entry per require_tokens value
+def _get_config(require_tokens: bool) -> SlackConfig:
+    """Build the cached SlackConfig behind get_config()"""
+    _load_dotenv()
+    return SlackConfig.from_env(_ENV, require_tokens=require_tokens)
+
+def __getattr__(name: str):
+    """Build the module-level `settings` instance on first access (PEP 562)
+
+    `from config import settings` then gives a plain object whose attributes can be
+    read without a function call, while importing this module still never raises.
+    """
+    if name == "settings":
+        settings = globals()["settings"] = get_config()
+        return settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
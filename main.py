@@ -1,21 +1,193 @@
 #!/usr/bin/env python3
+import os
+import re
+import sys
+import atexit
 import logging
+from logging.handlers import MemoryHandler
 import click
 from pathlib import Path
-import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; status falls back to loading whole files
+    ijson = None
 
 from config import get_config
-from migrator import SlackMigrator
+from storage import load_json, count_message_files, load_message_summary, message_summary_entry
 
 logger = logging.getLogger(__name__)
 
-def setup_logging(log_level: str):
-    """Setup logging configuration"""
+# Handlers installed by setup_logging; replaced when cli() runs again in the same process
+_log_handlers = []
+
+# cancel_futures needs Python 3.9+; on 3.8 the per-future cancel() calls cover queued channels
+_SHUTDOWN_OPTIONS = {"cancel_futures": True} if sys.version_info >= (3, 9) else {}
+
+def _flush_log_handlers():
+    """Write out buffered log records at exit"""
+    for handler in _log_handlers:
+        handler.flush()
+
+atexit.register(_flush_log_handlers)
+
+def setup_logging(log_level):
+    """Setup logging configuration
+
+    Calling it again (e.g. several cli() invocations from tests or scripts) replaces
+    the handlers from the previous call instead of adding more.
+
+    Args:
+        log_level: Level name (e.g. "DEBUG") or numeric logging level
+    """
+    root_logger = logging.getLogger()
+    for handler in _log_handlers:
+        # The memory handler comes first, so its buffer reaches the file before that is closed
+        root_logger.removeHandler(handler)
+        handler.close()
+    _log_handlers.clear()
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    # Buffer log file writes; anything at ERROR or above is flushed straight away
+    file_handler = logging.FileHandler('slack_migrator.log', delay=True)
+    file_handler.setFormatter(formatter)
+    memory_handler = MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
+    _log_handlers.extend([memory_handler, file_handler, console_handler])
     logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        level=log_level if isinstance(log_level, int) else getattr(logging, log_level.upper()),
+        handlers=[memory_handler, console_handler]
     )
 
+def count_channel_messages(file_path):
+    """Count messages and attached files in a channel message file
+
+    With ijson the file is streamed, so memory use stays flat however large
+    the channel is.
+
+    Returns:
+        Tuple of (message count, file count, whether the file records an error)
+    """
+    if ijson is None:
+        channel_data = load_json(file_path)
+        messages = channel_data.get("messages", [])
+        return len(messages), count_message_files(messages), bool(channel_data.get("error"))
+
+    message_count = 0
+    file_count = 0
+    has_error = False
+    with open(file_path, 'rb') as f:
+        # One pass over the parser events; nothing but the counters is kept in memory
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'error':
+                # Scalars carry their value, and a non-empty object emits a map_key
+                # event with a key name, so this mirrors bool(error)
+                has_error = has_error or bool(value)
+            elif prefix == 'error.item':
+                has_error = True  # Non-empty array
+            elif event == 'start_map':
+                if prefix == 'messages.item':
+                    message_count += 1
+                elif prefix == 'messages.item.files.item':
+                    file_count += 1
+    return message_count, file_count, has_error
+
+def iter_files(directory):
+    """Recursively yield os.DirEntry objects for the regular files under a directory
+
+    DirEntry caches the file type from the directory listing, so this needs far
+    fewer system calls than Path.rglob() followed by is_file() and stat().
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+# Channel list line: the name with an optional # prefix. Lines starting with
+# "##" or "# " are comments.
+_CHANNEL_LINE_RE = re.compile(r'(?!##|# )#?(.*)')
+
+def parse_channels_file(channels_file):
+    """Read channel names from a channel list file (one per line, # prefix optional)"""
+    channel_names = []
+    for line in Path(channels_file).read_text(encoding='utf-8').splitlines():
+        match = _CHANNEL_LINE_RE.match(line.strip())
+        if match:
+            channel_name = match.group(1).strip()
+            if channel_name:
+                channel_names.append(channel_name)
+    return channel_names
+
+def tally_files(entries):
+    """Count files by extension and add up their sizes
+
+    Args:
+        entries: os.DirEntry objects for regular files
+
+    Returns:
+        Tuple of (Counter of extension -> file count, total size in bytes)
+    """
+    file_counts = Counter()
+    total_size = 0
+    for entry in entries:
+        file_ext = os.path.splitext(entry.name)[1].lower() or 'no_extension'
+        file_counts[file_ext] += 1
+        try:
+            total_size += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass
+    return file_counts, total_size
+
+def index_channel_files(messages_dir):
+    """Map channel names to their message files with a single directory read
+
+    Channel files are named {channel_name}_{channel_id}.json, and channel names
+    may themselves contain underscores.
+    """
+    channel_files = {}
+    with os.scandir(messages_dir) as entries:
+        for entry in entries:
+            filename_without_ext, ext = os.path.splitext(entry.name)
+            if ext != '.json' or not entry.is_file():
+                continue
+
+            # Split off the last part, which should be the channel ID (starts with 'C')
+            name_part, separator, potential_channel_id = filename_without_ext.rpartition('_')
+            if separator:
+                if (potential_channel_id.startswith('C') and
+                    len(potential_channel_id) >= 9 and
+                    potential_channel_id.isupper() and
+                    potential_channel_id.isalnum()):
+                    # Channel ID found, the rest is the channel name
+                    channel_name = name_part
+                else:
+                    # Fallback: use original logic if pattern doesn't match
+                    channel_name = filename_without_ext.partition('_')[0]
+            else:
+                # Single part filename, use as-is
+                channel_name = filename_without_ext
+
+            channel_files[channel_name] = Path(entry.path)
+    return channel_files
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+def format_size(size_bytes):
+    """Convert a byte count to a human readable size, e.g. 1536 -> "1.5 KB"""
+    # Each unit is 2**10 times the previous one, so the bit length picks it directly
+    unit_index = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit_index)):.1f} {_SIZE_UNITS[unit_index]}"
+
 def normalize_channel_data(channel_data):
     """
     Normalize channel data to handle both single-wrapped and double-wrapped structures.
@@ -69,22 +241,63 @@ def normalize_channel_data(channel_data):
         logger.debug("Channel data is already in single-wrapped format")
         return channel_data
 
+def load_channel_data(file_path, limit=None):
+    """Load and normalize a channel message file
+
+    When a positive limit is given and ijson is installed, the file is streamed
+    and parsing stops after the first `limit` messages, so testing with --limit
+    does not need to load a huge channel into memory.
+    """
+    if not limit or limit <= 0 or ijson is None:
+        return normalize_channel_data(load_json(file_path))
+
+    with open(file_path, 'rb') as f:
+        channel_info = next(ijson.items(f, 'channel_info', use_float=True), None)
+        if channel_info is None or "channel_info" in channel_info:
+            # Double-wrapped (or unexpected) layout: everything is nested under channel_info
+            return normalize_channel_data({"channel_info": channel_info or {}})
+
+        f.seek(0)
+        messages = list(islice(ijson.items(f, 'messages.item', use_float=True), limit))
+
+    return {"channel_info": channel_info, "messages": messages}
+
 @click.group()
-@click.option('--log-level', default='INFO', help='Logging level (DEBUG, INFO, WARNING, ERROR)')
+@click.option('--log-level', default=None, help='Logging level (DEBUG, INFO, WARNING, ERROR); defaults to LOG_LEVEL from .env or INFO')
 @click.pass_context
 def cli(ctx, log_level):
     """Slack Workspace Migrator - Download and upload Slack workspace data"""
     ctx.ensure_object(dict)
+
+    if log_level is None:
+        try:
+            log_level = get_config(require_tokens=False).log_level_no
+        except ValueError:
+            log_level = logging.INFO  # Configuration errors are reported below
     setup_logging(log_level)
 
-    try:
-        config = get_config()
-        ctx.obj['config'] = config
-        ctx.obj['migrator'] = SlackMigrator(config)
-    except Exception as e:
-        click.echo(f"Error loading configuration: {e}")
-        click.echo("Please check your .env file and ensure all required tokens are set.")
-        ctx.exit(1)
+def get_migrator(ctx):
+    """Get the SlackMigrator for this invocation, creating it on first use
+
+    Commands that only read local data never call this, so they do not need
+    Slack tokens or build API clients. The migrator lives in ctx.obj, so each
+    cli() invocation starts with fresh channel and file caches.
+    """
+    migrator = ctx.obj.get('migrator')
+    if migrator is None:
+        try:
+            config = get_config()
+            ctx.obj['config'] = config
+            # Imported here: the Slack SDK and requests dominate start-up time
+            from migrator import SlackMigrator
+            migrator = ctx.obj['migrator'] = SlackMigrator(config)
+            # One HTTP session serves every channel in the command; close it when the command ends
+            ctx.call_on_close(migrator.close)
+        except Exception as e:
+            click.echo(f"Error loading configuration: {e}")
+            click.echo("Please check your .env file and ensure all required tokens are set.")
+            ctx.exit(1)
+    return migrator
 
 @cli.command()
 @click.option('--channel', help='Download only a specific channel (by name)')
@@ -92,10 +305,11 @@ def cli(ctx, log_level):
 @click.option('--force', is_flag=True, help='Force re-download even if cached data exists')
 @click.option('--archive-download', is_flag=True, help='Enable downloading from archived channels by temporarily unarchiving them')
 @click.option('--update', is_flag=True, help='Check for and download new messages from completed channels')
+@click.option('--workers', type=click.IntRange(min=1), default=1, help='Number of channels to download in parallel')
 @click.pass_context
-def download(ctx, channel, channels_file, force, archive_download, update):
+def download(ctx, channel, channels_file, force, archive_download, update, workers):
     """Download data from source Slack workspace"""
-    migrator = ctx.obj['migrator']
+    migrator = get_migrator(ctx)
 
     # Validate conflicting options
     if force and update:
@@ -107,38 +321,15 @@ def download(ctx, channel, channels_file, force, archive_download, update):
         click.echo(f"📄 Reading channel list from: {channels_file}")
 
         try:
-            with open(channels_file, 'r') as f:
-                channel_lines = f.readlines()
-
-            # Parse channel names, removing # prefix and whitespace
-            channels_to_download = []
-            for line in channel_lines:
-                line = line.strip()
-                if not line:  # Skip empty lines
-                    continue
-
-                # Skip comment lines (lines that start with ## or # followed by space)
-                if line.startswith('##') or (line.startswith('# ') and len(line) > 2):
-                    continue
-
-                if line.startswith('#'):
-                    # Handle lines that start with #channel_name
-                    channel_name = line[1:].strip()  # Remove # prefix
-                else:
-                    # Handle lines without # prefix
-                    channel_name = line.strip()
-
-                if channel_name:
-                    channels_to_download.append(channel_name)
+            channels_to_download = parse_channels_file(channels_file)
 
             if not channels_to_download:
                 click.echo("❌ No valid channel names found in file")
                 ctx.exit(1)
 
             click.echo(f"📋 Found {len(channels_to_download)} channels to download:")
-            for i, ch in enumerate(channels_to_download, 1):
-                click.echo(f"   {i}. #{ch}")
-            click.echo()
+            # One write for the whole list rather than one per channel
+            click.echo("".join(f"   {i}. #{ch}\n" for i, ch in enumerate(channels_to_download, 1)))
 
             if archive_download:
                 click.echo("📦 Archive download enabled - will temporarily unarchive archived channels")
@@ -147,54 +338,68 @@ def download(ctx, channel, channels_file, force, archive_download, update):
             successful_downloads = 0
             failed_downloads = 0
 
-            for i, channel_name in enumerate(channels_to_download, 1):
-                click.echo(f"📥 [{i}/{len(channels_to_download)}] Downloading #{channel_name}...")
+            def download_channel(channel_name):
+                return migrator.download_single_channel(channel_name, force=force, enable_archive_download=archive_download, update=update)
 
-                try:
-                    data = migrator.download_single_channel(channel_name, force=force, enable_archive_download=archive_download, update=update)
-                    if data:
-                        from_cache = data.get('from_cache', False)
-                        partial_download = data.get('partial_download', False)
-                        was_archived = data.get('was_archived', False)
-                        up_to_date = data.get('up_to_date', False)
-                        updated = data.get('updated', False)
-                        new_messages_count = data.get('new_messages_count', 0)
-                        update_failed = data.get('update_failed', False)
-
-                        if update_failed:
-                            status_icon = "⚠️"
-                            source_text = "update check failed, using cache"
-                        elif up_to_date:
-                            status_icon = "✅"
-                            source_text = "up to date"
-                        elif updated:
-                            status_icon = "🔄"
-                            source_text = f"updated with {new_messages_count} new messages"
-                        elif partial_download:
-                            status_icon = "⚠️"
-                            source_text = "partially downloaded (interrupted)"
-                        elif from_cache:
-                            status_icon = "📁"
-                            source_text = "from cache"
-                        else:
-                            status_icon = "✅"
-                            source_text = "downloaded"
+            # With --workers, channels are downloaded concurrently up front and the
+            # results below are still reported in file order
+            pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+            with pool as executor:
+                futures = [executor.submit(download_channel, name) for name in channels_to_download] if executor else None
 
-                        archive_indicator = " 📦" if was_archived else ""
-                        click.echo(f"   {status_icon} #{channel_name} {source_text} - {len(data.get('messages', []))} messages, {data.get('file_count', 0)} files{archive_indicator}")
-                        successful_downloads += 1
-                    else:
-                        click.echo(f"   ❌ #{channel_name} not found or could not be accessed")
-                        failed_downloads += 1
+                for i, channel_name in enumerate(channels_to_download, 1):
+                    click.echo(f"📥 [{i}/{len(channels_to_download)}] Downloading #{channel_name}...")
 
-                except KeyboardInterrupt:
-                    click.echo(f"\n⚠️  Download interrupted at channel #{channel_name}")
-                    click.echo(f"   Completed: {successful_downloads}/{len(channels_to_download)} channels")
-                    click.echo("   Run the command again to resume from where it left off.")
-                    ctx.exit(0)
-                except Exception as e:
-                    click.echo(f"   ❌ #{channel_name} failed: {e}")
-                    failed_downloads += 1
+                    try:
+                        data = futures[i - 1].result() if futures else download_channel(channel_name)
+                        if data:
+                            from_cache = data.get('from_cache', False)
+                            partial_download = data.get('partial_download', False)
+                            was_archived = data.get('was_archived', False)
+                            up_to_date = data.get('up_to_date', False)
+                            updated = data.get('updated', False)
+                            new_messages_count = data.get('new_messages_count', 0)
+                            update_failed = data.get('update_failed', False)
+
+                            if update_failed:
+                                status_icon = "⚠️"
+                                source_text = "update check failed, using cache"
+                            elif up_to_date:
+                                status_icon = "✅"
+                                source_text = "up to date"
+                            elif updated:
+                                status_icon = "🔄"
+                                source_text = f"updated with {new_messages_count} new messages"
+                            elif partial_download:
+                                status_icon = "⚠️"
+                                source_text = "partially downloaded (interrupted)"
+                            elif from_cache:
+                                status_icon = "📁"
+                                source_text = "from cache"
+                            else:
+                                status_icon = "✅"
+                                source_text = "downloaded"
+
+                            archive_indicator = " 📦" if was_archived else ""
+                            click.echo(f"   {status_icon} #{channel_name} {source_text} - {len(data.get('messages', []))} messages, {data.get('file_count', 0)} files{archive_indicator}")
+                            successful_downloads += 1
+                        else:
+                            click.echo(f"   ❌ #{channel_name} not found or could not be accessed")
+                            failed_downloads += 1
+
+                    except KeyboardInterrupt:
+                        if futures:
+                            # Channels already in progress finish saving; queued ones are dropped
+                            for future in futures:
+                                future.cancel()
+                            executor.shutdown(wait=False, **_SHUTDOWN_OPTIONS)
+                        click.echo(f"\n⚠️  Download interrupted at channel #{channel_name}")
+                        click.echo(f"   Completed: {successful_downloads}/{len(channels_to_download)} channels")
+                        click.echo("   Run the command again to resume from where it left off.")
+                        ctx.exit(0)
+                    except Exception as e:
+                        click.echo(f"   ❌ #{channel_name} failed: {e}")
+                        failed_downloads += 1
 
             # Summary
             click.echo(f"\n🎯 Batch download complete!")
@@ -272,7 +477,7 @@ def download(ctx, channel, channels_file, force, archive_download, update):
         archive_msg = " (with archive download enabled)" if archive_download else ""
         click.echo(f"Starting download from source workspace{archive_msg}...")
         try:
-            data = migrator.download_workspace_data(force=force, enable_archive_download=archive_download)
+            data = migrator.download_workspace_data(force=force, enable_archive_download=archive_download, workers=workers)
             click.echo(f"✅ Download completed! Data saved to {migrator.output_dir}")
 
             # Count what was actually downloaded vs cached
@@ -288,8 +493,7 @@ def download(ctx, channel, channels_file, force, archive_download, update):
 
             for channel_data in data.get('messages', {}).values():
                 messages = channel_data.get('messages', [])
-                for message in messages:
-                    total_files += len(message.get('files', []))
+                total_files += count_message_files(messages)
 
                 # Check if channel download was completed
                 if channel_data.get('download_completed', False):
@@ -341,7 +545,7 @@ def download(ctx, channel, channels_file, force, archive_download, update):
 @click.pass_context
 def upload(ctx, channel, channels_file, dry_run, limit):
     """Upload data to destination Slack workspace"""
-    migrator = ctx.obj['migrator']
+    migrator = get_migrator(ctx)
 
     if dry_run:
         click.echo("🔍 Dry run mode - showing what would be uploaded...")
@@ -351,73 +555,25 @@ def upload(ctx, channel, channels_file, dry_run, limit):
         click.echo(f"📄 Reading channel list from: {channels_file}")
 
         try:
-            with open(channels_file, 'r') as f:
-                channel_lines = f.readlines()
-
-            # Parse channel names, removing # prefix and whitespace
-            channels_to_upload = []
-            for line in channel_lines:
-                line = line.strip()
-                if not line:  # Skip empty lines
-                    continue
-
-                # Skip comment lines (lines that start with ## or # followed by space)
-                if line.startswith('##') or (line.startswith('# ') and len(line) > 2):
-                    continue
-
-                if line.startswith('#'):
-                    # Handle lines that start with #channel_name
-                    channel_name = line[1:].strip()  # Remove # prefix
-                else:
-                    # Handle lines without # prefix
-                    channel_name = line.strip()
-
-                if channel_name:
-                    channels_to_upload.append(channel_name)
+            channels_to_upload = parse_channels_file(channels_file)
 
             if not channels_to_upload:
                 click.echo("❌ No valid channel names found in file")
                 ctx.exit(1)
 
             click.echo(f"📋 Found {len(channels_to_upload)} channels to upload:")
-            for i, ch in enumerate(channels_to_upload, 1):
-                click.echo(f"   {i}. #{ch}")
-            click.echo()
+            # One write for the whole list rather than one per channel
+            click.echo("".join(f"   {i}. #{ch}\n" for i, ch in enumerate(channels_to_upload, 1)))
 
             # Check if we have data for these channels
-            output_dir = Path(migrator.output_dir)
-            messages_dir = output_dir / "messages"
+            messages_dir = migrator.messages_dir
 
             if not messages_dir.exists():
                 click.echo("❌ No downloaded data found. Please run download first.")
                 ctx.exit(1)
 
             # Find available channel files and match with requested channels
-            available_channels = {}
-            for file_path in messages_dir.glob("*.json"):
-                # Channel files are named: {channel_name}_{channel_id}.json
-                # We need to extract channel_name by removing the channel_id suffix
-                filename_without_ext = file_path.stem
-
-                # Split by underscore and find the channel ID (last part starting with 'C')
-                parts = filename_without_ext.split('_')
-                if len(parts) >= 2:
-                    # Last part should be the channel ID (starts with 'C')
-                    potential_channel_id = parts[-1]
-                    if (potential_channel_id.startswith('C') and
-                        len(potential_channel_id) >= 9 and
-                        potential_channel_id.isupper() and
-                        potential_channel_id.isalnum()):
-                        # Channel ID found, reconstruct channel name from remaining parts
-                        channel_name = '_'.join(parts[:-1])
-                    else:
-                        # Fallback: use original logic if pattern doesn't match
-                        channel_name = parts[0]
-                else:
-                    # Single part filename, use as-is
-                    channel_name = filename_without_ext
-
-                available_channels[channel_name] = file_path
+            available_channels = index_channel_files(messages_dir)
 
             # Validate that we have data for all requested channels
             missing_channels = []
@@ -430,11 +586,9 @@ def upload(ctx, channel, channels_file, dry_run, limit):
 
             if missing_channels:
                 click.echo(f"❌ Missing data for {len(missing_channels)} channels:")
-                for ch in missing_channels:
-                    click.echo(f"   - #{ch}")
+                click.echo("\n".join(f"   - #{ch}" for ch in missing_channels))
                 click.echo(f"\nAvailable channels:")
-                for ch in sorted(available_channels.keys()):
-                    click.echo(f"   - #{ch}")
+                click.echo("\n".join(f"   - #{ch}" for ch in sorted(available_channels)))
                 ctx.exit(1)
 
             if dry_run:
@@ -444,8 +598,7 @@ def upload(ctx, channel, channels_file, dry_run, limit):
 
                 for channel_name, file_path in valid_channels:
                     try:
-                        with open(file_path, 'r') as f:
-                            channel_data = json.load(f)
+                        channel_data = load_json(file_path)
 
                         # Normalize the channel data structure
                         channel_data = normalize_channel_data(channel_data)
@@ -456,7 +609,7 @@ def upload(ctx, channel, channels_file, dry_run, limit):
                         if limit and limit > 0:
                             messages = messages[:limit]
 
-                        files_count = sum(len(msg.get("files", [])) for msg in messages)
+                        files_count = count_message_files(messages)
                         total_messages += len(messages)
                         total_files += files_count
 
@@ -485,8 +638,7 @@ def upload(ctx, channel, channels_file, dry_run, limit):
 
                 try:
                     # Load channel data
-                    with open(file_path, 'r') as f:
-                        channel_data = json.load(f)
+                    channel_data = load_json(file_path)
 
                     # Normalize the channel data structure
                     channel_data = normalize_channel_data(channel_data)
@@ -498,18 +650,18 @@ def upload(ctx, channel, channels_file, dry_run, limit):
                         messages = messages[:limit]
                         click.echo(f"ℹ️  Limited to first {limit} messages for testing")
 
-                    files_count = sum(len(msg.get("files", [])) for msg in messages)
+                    files_count = count_message_files(messages)
 
                     if not messages:
                         click.echo(f"   ⚠️  #{channel_name} has no messages to upload")
                         continue
 
                     # Create upload data structure for single channel
-                    limited_channel_data = channel_data.copy()
-                    limited_channel_data["messages"] = messages
+                    # channel_data is not used again, so the (possibly limited) messages go in place
+                    channel_data["messages"] = messages
 
                     upload_data = {
-                        "messages": {channel_data["channel_info"]["id"]: limited_channel_data}
+                        "messages": {channel_data["channel_info"]["id"]: channel_data}
                     }
 
                     # Perform the upload
@@ -542,55 +694,26 @@ def upload(ctx, channel, channels_file, dry_run, limit):
         click.echo(f"Starting upload of channel #{channel} to destination workspace...")
 
         # Check if we have data for this channel
-        output_dir = Path(migrator.output_dir)
-        messages_dir = output_dir / "messages"
+        messages_dir = migrator.messages_dir
 
         if not messages_dir.exists():
             click.echo("❌ No downloaded data found. Please run download first.")
             ctx.exit(1)
 
         # Find the channel file
-        channel_file = None
-        for file_path in messages_dir.glob(f"{channel}_*.json"):
-            channel_file = file_path
-            break
+        available_channels = index_channel_files(messages_dir)
+        channel_file = available_channels.get(channel)
 
         if not channel_file:
             click.echo(f"❌ No data found for channel #{channel}")
             click.echo("Available channels:")
-            for file_path in messages_dir.glob("*.json"):
-                # Channel files are named: {channel_name}_{channel_id}.json
-                # We need to extract channel_name by removing the channel_id suffix
-                filename_without_ext = file_path.stem
-
-                # Split by underscore and find the channel ID (last part starting with 'C')
-                parts = filename_without_ext.split('_')
-                if len(parts) >= 2:
-                    # Last part should be the channel ID (starts with 'C')
-                    potential_channel_id = parts[-1]
-                    if (potential_channel_id.startswith('C') and
-                        len(potential_channel_id) >= 9 and
-                        potential_channel_id.isupper() and
-                        potential_channel_id.isalnum()):
-                        # Channel ID found, reconstruct channel name from remaining parts
-                        channel_name = '_'.join(parts[:-1])
-                    else:
-                        # Fallback: use original logic if pattern doesn't match
-                        channel_name = parts[0]
-                else:
-                    # Single part filename, use as-is
-                    channel_name = filename_without_ext
-
-                click.echo(f"  - {channel_name}")
+            click.echo("\n".join(f"  - {channel_name}" for channel_name in available_channels))
             ctx.exit(1)
 
         # Load channel data
         try:
-            with open(channel_file, 'r') as f:
-                channel_data = json.load(f)
-
-            # Normalize the channel data structure
-            channel_data = normalize_channel_data(channel_data)
+            # With --limit only the first messages are read from the file
+            channel_data = load_channel_data(channel_file, limit)
 
             messages = channel_data.get("messages", [])
 
@@ -599,7 +722,7 @@ def upload(ctx, channel, channels_file, dry_run, limit):
                 messages = messages[:limit]
                 click.echo(f"ℹ️  Limited to first {limit} messages for testing")
 
-            files_count = sum(len(msg.get("files", [])) for msg in messages)
+            files_count = count_message_files(messages)
 
             if dry_run:
                 click.echo(f"📋 Would upload to #{channel}:")
@@ -613,11 +736,11 @@ def upload(ctx, channel, channels_file, dry_run, limit):
             click.echo(f"   - Files: {files_count}")
 
             # Create a mock data structure for single channel upload
-            limited_channel_data = channel_data.copy()
-            limited_channel_data["messages"] = messages
+            # channel_data is not used again, so the (possibly limited) messages go in place
+            channel_data["messages"] = messages
 
             upload_data = {
-                "messages": {channel_data["channel_info"]["id"]: limited_channel_data}
+                "messages": {channel_data["channel_info"]["id"]: channel_data}
             }
 
             try:
@@ -636,13 +759,13 @@ def upload(ctx, channel, channels_file, dry_run, limit):
         click.echo("Starting upload to destination workspace...")
         if dry_run:
             # Show what would be uploaded
-            data = migrator.load_data()
-            total_messages = sum(len(ch_data.get("messages", [])) for ch_data in data.get("messages", {}).values())
-            total_files = sum(
-                len(msg.get("files", []))
-                for ch_data in data.get("messages", {}).values()
-                for msg in ch_data.get("messages", [])
-            )
+            data = migrator.load_data(include_messages=False)
+            total_messages = 0
+            total_files = 0
+            for _, ch_data in migrator.iter_channel_messages():
+                messages = ch_data.get("messages", [])
+                total_messages += len(messages)
+                total_files += count_message_files(messages)
             click.echo(f"📋 Would upload:")
             click.echo(f"   - Channels: {len(data.get('channels', []))}")
             click.echo(f"   - Messages: {total_messages}")
@@ -660,7 +783,7 @@ def upload(ctx, channel, channels_file, dry_run, limit):
 @click.pass_context
 def migrate(ctx):
     """Run complete migration (download + upload)"""
-    migrator = ctx.obj['migrator']
+    migrator = get_migrator(ctx)
 
     click.echo("Starting complete migration...")
     try:
@@ -674,8 +797,8 @@ def migrate(ctx):
 @click.pass_context
 def info(ctx):
     """Show workspace information"""
+    migrator = get_migrator(ctx)
     config = ctx.obj['config']
-    migrator = ctx.obj['migrator']
 
     click.echo("=== Source Workspace ===")
     try:
@@ -704,8 +827,12 @@ def info(ctx):
 @click.pass_context
 def status(ctx):
     """Show migration status and downloaded data"""
-    migrator = ctx.obj['migrator']
-    output_dir = Path(migrator.output_dir)
+    # Only local files are read, so Slack tokens are not required
+    try:
+        output_dir = Path(get_config(require_tokens=False).output_dir)
+    except ValueError as e:
+        click.echo(f"Error loading configuration: {e}")
+        ctx.exit(1)
 
     if not output_dir.exists():
         click.echo("No migration data found.")
@@ -713,51 +840,56 @@ def status(ctx):
 
     click.echo("=== Downloaded Data Status ===")
 
+    # Read the three metadata files concurrently; each check below takes its own result
+    # (a missing file shows up as FileNotFoundError)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        workspace_future, users_future, channels_future = [
+            executor.submit(load_json, output_dir / name)
+            for name in ("workspace_info.json", "users.json", "channels.json")
+        ]
+
     # Check workspace info
-    workspace_file = output_dir / "workspace_info.json"
-    if workspace_file.exists():
-        try:
-            with open(workspace_file) as f:
-                workspace_info = json.load(f)
-            team_name = workspace_info.get("team", {}).get("name", "Unknown")
-            click.echo(f"✅ Workspace info ({team_name})")
-        except Exception as e:
-            click.echo(f"⚠️  Workspace info (corrupted: {e})")
-    else:
+    try:
+        workspace_info = workspace_future.result()
+        team_name = workspace_info.get("team", {}).get("name", "Unknown")
+        click.echo(f"✅ Workspace info ({team_name})")
+    except FileNotFoundError:
         click.echo("❌ Workspace info")
+    except Exception as e:
+        click.echo(f"⚠️  Workspace info (corrupted: {e})")
 
     # Check users
-    users_file = output_dir / "users.json"
-    if users_file.exists():
-        try:
-            with open(users_file) as f:
-                users = json.load(f)
-            click.echo(f"✅ Users ({len(users)} users)")
-        except Exception as e:
-            click.echo(f"⚠️  Users (corrupted: {e})")
-    else:
+    try:
+        users = users_future.result()
+        click.echo(f"✅ Users ({len(users)} users)")
+    except FileNotFoundError:
         click.echo("❌ Users")
+    except Exception as e:
+        click.echo(f"⚠️  Users (corrupted: {e})")
 
     # Check channels
-    channels_file = output_dir / "channels.json"
-    if channels_file.exists():
-        try:
-            with open(channels_file) as f:
-                channels = json.load(f)
-            click.echo(f"✅ Channels ({len(channels)} channels)")
-
-            # Show channel breakdown
-            public_channels = sum(1 for ch in channels if not ch.get("is_private", False) and not ch.get("is_archived", False))
-            private_channels = sum(1 for ch in channels if ch.get("is_private", False) and not ch.get("is_archived", False))
-            archived_channels = sum(1 for ch in channels if ch.get("is_archived", False))
-
-            click.echo(f"   - Public: {public_channels}")
-            click.echo(f"   - Private: {private_channels}")
-            click.echo(f"   - Archived: {archived_channels}")
-        except Exception as e:
-            click.echo(f"⚠️  Channels (corrupted: {e})")
-    else:
+    try:
+        channels = channels_future.result()
+        click.echo(f"✅ Channels ({len(channels)} channels)")
+
+        # Show channel breakdown
+        # One pass, looking up each flag once per channel
+        archived_channels = 0
+        private_channels = 0
+        for ch in channels:
+            if ch.get("is_archived", False):
+                archived_channels += 1
+            elif ch.get("is_private", False):
+                private_channels += 1
+        public_channels = len(channels) - archived_channels - private_channels
+
+        click.echo(f"   - Public: {public_channels}")
+        click.echo(f"   - Private: {private_channels}")
+        click.echo(f"   - Archived: {archived_channels}")
+    except FileNotFoundError:
         click.echo("❌ Channels")
+    except Exception as e:
+        click.echo(f"⚠️  Channels (corrupted: {e})")
 
     # Check messages
     messages_dir = output_dir / "messages"
@@ -771,26 +903,38 @@ def status(ctx):
         channels_with_errors = 0
         successful_channels = 0
 
-        for file_path in message_files:
+        # Counts recorded by the downloader; only files changed since then are parsed.
+        # The summary is only read here - the downloader is its sole writer.
+        summary = load_message_summary(output_dir)
+
+        def scan(file_path):
             try:
-                with open(file_path) as f:
-                    channel_data = json.load(f)
-                messages = channel_data.get("messages", [])
-                if channel_data.get("error"):
-                    channels_with_errors += 1
-                else:
-                    successful_channels += 1
-                    total_messages += len(messages)
-                    # Count files in messages
-                    for message in messages:
-                        total_files += len(message.get("files", []))
+                stat = file_path.stat()
+                entry = summary.get(file_path.name)
+                if not (entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size):
+                    entry = message_summary_entry(file_path, *count_channel_messages(file_path), stat=stat)
+                return entry["messages"], entry["files"], entry["error"]
             except Exception:
+                return None  # Unreadable or corrupted file
+
+        # Files are independent, so overlap their disk reads and parsing
+        with ThreadPoolExecutor() as executor:
+            results = list(executor.map(scan, message_files))
+
+        for result in results:
+            if result is None or result[2]:
                 channels_with_errors += 1
+            else:
+                successful_channels += 1
+                total_messages += result[0]
+                total_files += result[1]
 
-        click.echo(f"   - Successful downloads: {successful_channels}")
-        click.echo(f"   - Failed downloads: {channels_with_errors}")
-        click.echo(f"   - Total messages: {total_messages}")
-        click.echo(f"   - Total files: {total_files}")
+        click.echo(
+            f"   - Successful downloads: {successful_channels}\n"
+            f"   - Failed downloads: {channels_with_errors}\n"
+            f"   - Total messages: {total_messages}\n"
+            f"   - Total files: {total_files}"
+        )
 
         if channels_with_errors > 0:
             click.echo("   ⚠️  Some channels had download errors")
@@ -800,63 +944,55 @@ def status(ctx):
     # Check files directory
     files_dir = output_dir / "files"
     if files_dir.exists():
-        # Count files by type
-        file_counts = {}
-        total_size = 0
-
-        for file_path in files_dir.rglob("*"):
-            if file_path.is_file():
-                file_ext = file_path.suffix.lower() or 'no_extension'
-                file_counts[file_ext] = file_counts.get(file_ext, 0) + 1
-                try:
-                    total_size += file_path.stat().st_size
-                except:
-                    pass
+        # Count files by type. Attachments are stored in one directory per channel,
+        # so the channel directories are walked in parallel and the tallies merged.
+        with os.scandir(files_dir) as entries:
+            top_level = list(entries)
+        channel_dirs = [entry.path for entry in top_level if entry.is_dir(follow_symlinks=False)]
+        file_counts, total_size = tally_files(entry for entry in top_level if entry.is_file(follow_symlinks=False))
+
+        with ThreadPoolExecutor() as executor:
+            for dir_counts, dir_size in executor.map(lambda path: tally_files(iter_files(path)), channel_dirs):
+                file_counts.update(dir_counts)
+                total_size += dir_size
 
         total_file_count = sum(file_counts.values())
 
         if total_file_count > 0:
-            # Convert bytes to human readable
-            def format_size(size_bytes):
-                for unit in ['B', 'KB', 'MB', 'GB']:
-                    if size_bytes < 1024:
-                        return f"{size_bytes:.1f} {unit}"
-                    size_bytes /= 1024
-                return f"{size_bytes:.1f} TB"
-
             click.echo(f"✅ Files ({total_file_count} files, {format_size(total_size)})")
 
             # Show top file types
-            sorted_types = sorted(file_counts.items(), key=lambda x: x[1], reverse=True)
-            for ext, count in sorted_types[:5]:  # Show top 5 file types
+            lines = []
+            for ext, count in file_counts.most_common(5):  # Show top 5 file types
                 ext_display = ext if ext != 'no_extension' else 'no extension'
-                click.echo(f"   - {ext_display}: {count}")
+                lines.append(f"   - {ext_display}: {count}")
 
-            if len(sorted_types) > 5:
-                click.echo(f"   - ... and {len(sorted_types) - 5} other types")
+            if len(file_counts) > 5:
+                lines.append(f"   - ... and {len(file_counts) - 5} other types")
+            click.echo("\n".join(lines))
 
         else:
             click.echo("📁 Files directory exists but is empty")
     else:
         click.echo("❌ Files")
 
+# Fixed parts of the count listing, built once instead of on every row
+_SEPARATOR = "=" * 60
+_UNKNOWN_COLUMN = f"{'Unknown':>10}"
+_REQUIRES_INVITE_COLUMN = f"{'Requires invite':>15}"
+
 @cli.command()
 @click.option('--channel', help='Show count for only a specific channel (by name)')
 @click.pass_context
 def count(ctx, channel):
     """Show estimated message counts for channels"""
-    migrator = ctx.obj['migrator']
+    migrator = get_migrator(ctx)
 
     if channel:
         click.echo(f"Getting message count for channel #{channel}...")
         try:
-            # Get all channels to find the target channel
-            all_channels = migrator.source_client.get_channels()
-            target_channel = None
-            for ch in all_channels:
-                if ch.get("name") == channel:
-                    target_channel = ch
-                    break
+            # Look up the target channel by name
+            target_channel = migrator.source_client.channels_by_name.get(channel)
 
             if not target_channel:
                 click.echo(f"❌ Channel #{channel} not found")
@@ -897,27 +1033,25 @@ def count(ctx, channel):
             accessible_channels = []
             inaccessible_channels = []
 
+            # One pass; each flag is only looked up when the previous one does not settle it
+            add_accessible = accessible_channels.append
+            add_inaccessible = inaccessible_channels.append
             for ch in channels_with_estimates:
-                channel_name = ch.get("name", ch["id"])
-                is_private = ch.get("is_private", False)
-                is_member = ch.get("is_member", False)
-                is_archived = ch.get("is_archived", False)
-
-                if is_archived:
+                if ch.get("is_archived", False):
                     continue  # Skip archived channels
 
-                if is_private and not is_member:
-                    inaccessible_channels.append(ch)
+                if ch.get("is_private", False) and not ch.get("is_member", False):
+                    add_inaccessible(ch)
                 else:
-                    accessible_channels.append(ch)
+                    add_accessible(ch)
 
             # Show accessible channels with counts
             if accessible_channels:
-                click.echo(f"\n📊 Accessible Channels ({len(accessible_channels)}):")
-                click.echo("=" * 60)
+                click.echo(f"\n📊 Accessible Channels ({len(accessible_channels)}):\n{_SEPARATOR}")
 
                 total_estimated = 0
                 channels_with_estimates_count = 0
+                lines = []
 
                 for ch in accessible_channels:
                     channel_name = ch.get("name", ch["id"])
@@ -927,24 +1061,27 @@ def count(ctx, channel):
                     type_indicator = "🔒" if is_private else "📢"
 
                     if estimated_count is not None:
-                        click.echo(f"   {type_indicator} #{channel_name:<20} ~{estimated_count:>6,} messages")
+                        lines.append(f"   {type_indicator} #{channel_name:<20} ~{estimated_count:>6,} messages")
                         total_estimated += estimated_count
                         channels_with_estimates_count += 1
                     else:
-                        click.echo(f"   {type_indicator} #{channel_name:<20} {'Unknown':>10}")
+                        lines.append(f"   {type_indicator} #{channel_name:<20} {_UNKNOWN_COLUMN}")
+
+                click.echo("\n".join(lines))
 
                 if channels_with_estimates_count > 0:
-                    click.echo("=" * 60)
-                    click.echo(f"   📈 Total estimated (known): ~{total_estimated:,} messages")
-                    click.echo(f"   📋 Channels with estimates: {channels_with_estimates_count}/{len(accessible_channels)}")
+                    click.echo(
+                        f"{_SEPARATOR}\n"
+                        f"   📈 Total estimated (known): ~{total_estimated:,} messages\n"
+                        f"   📋 Channels with estimates: {channels_with_estimates_count}/{len(accessible_channels)}"
+                    )
 
             # Show inaccessible channels
             if inaccessible_channels:
-                click.echo(f"\n🔒 Inaccessible Private Channels ({len(inaccessible_channels)}):")
-                click.echo("=" * 60)
-                for ch in inaccessible_channels:
-                    channel_name = ch.get("name", ch["id"])
-                    click.echo(f"   🔒 #{channel_name:<20} {'Requires invite':>15}")
+                click.echo(f"\n🔒 Inaccessible Private Channels ({len(inaccessible_channels)}):\n{_SEPARATOR}")
+                click.echo("\n".join(
+                    f"   🔒 #{ch.get('name', ch['id']):<20} {_REQUIRES_INVITE_COLUMN}" for ch in inaccessible_channels
+                ))
 
             if not accessible_channels and not inaccessible_channels:
                 click.echo("No channels found or all channels are archived")
@@ -958,7 +1095,7 @@ def count(ctx, channel):
 @click.pass_context
 def diagnose(ctx, channel_name):
     """Diagnose access issues for a specific channel"""
-    migrator = ctx.obj['migrator']
+    migrator = get_migrator(ctx)
 
     click.echo(f"🔍 Diagnosing access to channel #{channel_name}...")
     try:
@@ -1,21 +1,70 @@
 import os
-import json
+import sys
+import shutil
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+from datetime import datetime, timezone, tzinfo
 import pytz
 from tqdm import tqdm
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import atexit
+import threading
+import uuid
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
 
 from slack_client import SlackClient
 from slack_sdk.errors import SlackApiError
 from config import SlackConfig
+from storage import load_json, dump_json, append_json_lines, load_json_lines, iter_message_file_infos, iter_message_timestamps, count_message_files, load_message_summary, save_message_summary, message_summary_entry
 
 logger = logging.getLogger(__name__)
 
+# Chunk size used when writing downloaded files to disk
+FILE_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Downloads at least this large get their disk space reserved before writing
+PREALLOCATE_MIN_SIZE = 4 * 1024 * 1024
+
+# Attachments at least this large are streamed to Slack from disk instead of read into memory
+STREAM_UPLOAD_MIN_SIZE = 8 * 1024 * 1024
+
+# cancel_futures needs Python 3.9+; on 3.8 queued downloads still run before shutdown returns
+_SHUTDOWN_OPTIONS = {"cancel_futures": True} if sys.version_info >= (3, 9) else {}
+
+# Characters replaced by '_' in downloaded file names
+_UNSAFE_FILENAME_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Create a downloaded file only if the name is free (binary mode matters on Windows)
+_NEW_FILE_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+
+# Attachments are often re-shared, so the same names come up repeatedly across channels
+@lru_cache(maxsize=4096)
+def _safe_filename(filename: str) -> str:
+    """Replace unsafe characters in a file name and clip its length"""
+    # Replace unsafe characters in a single pass
+    safe_filename = filename.translate(_UNSAFE_FILENAME_TABLE)
+
+    # Limit length to avoid filesystem issues. Limits are in bytes, and names in
+    # e.g. Japanese take three bytes per character, so measure the encoded name.
+    if len(os.fsencode(safe_filename)) > 200:
+        name, ext = os.path.splitext(safe_filename)
+        budget = max(200 - len(os.fsencode(ext)), 0)
+        name = os.fsencode(name)[:budget].decode(sys.getfilesystemencoding(), errors="ignore")
+        safe_filename = name + ext
+
+    return safe_filename
+
+@lru_cache(maxsize=8192)
+def _format_seconds(seconds: int, tz: tzinfo) -> str:
+    """Format whole Unix seconds in the given timezone (messages often share a second)"""
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).astimezone(tz).strftime("%Y/%m/%d %H:%M:%S JST")
+
 class SlackMigrator:
     """Main class for migrating Slack workspace data"""
 
@@ -24,7 +73,9 @@ class SlackMigrator:
         self.source_client = SlackClient(
             config.source_token,
             config.rate_limit_delay,
-            config.max_retries
+            config.max_retries,
+            file_rate_per_sec=config.file_rate_per_sec,
+            file_burst=config.file_burst
         )
         self.dest_client = SlackClient(
             config.dest_token,
@@ -51,16 +102,119 @@ class SlackMigrator:
         self.files_dir = self.output_dir / "files"
         self.files_dir.mkdir(exist_ok=True)
 
+        # Per-channel message files (created when the first channel is saved)
+        self.messages_dir = self.output_dir / "messages"
+
         # Mapping for user IDs between workspaces
         self.user_mapping: Dict[str, str] = {}
         self.channel_mapping: Dict[str, str] = {}
 
         # Track downloaded files to avoid duplicates
         self.downloaded_files: Dict[str, str] = {}  # file_id -> local_path
+        self._downloaded_files_indexed = False  # Whether saved channel files were scanned
+        self._downloaded_files_lock = threading.Lock()
 
         # JST timezone
         self.jst = pytz.timezone('Asia/Tokyo')
 
+        # Shared HTTP session and thread pool for file downloads (created on first use)
+        self._http_session: Optional[requests.Session] = None
+        self._file_executor: Optional[ThreadPoolExecutor] = None
+        self._file_executor_lock = threading.Lock()
+
+        # Downloads queued or running, per Slack file ID, so a file shared in several messages
+        # or channels is fetched once
+        self._file_downloads: Dict[str, Future] = {}
+        self._file_downloads_lock = threading.Lock()
+
+        # Guard shared files when several channels are downloaded in parallel
+        self._prerequisites_lock = threading.Lock()
+        self._summary_lock = threading.Lock()
+
+        # Message summary entries for channel files saved since the summary was last written
+        self._pending_summary: Dict[str, Dict[str, Any]] = {}
+        atexit.register(self._flush_message_summary)
+
+        # Destination channels, fetched on first use (see _get_dest_channels_cached)
+        self._dest_channels_cache: Optional[List[Dict[str, Any]]] = None
+        self._dest_channels_by_name: Dict[str, Dict[str, Any]] = {}
+
+        # Channel ID -> message file, built on first use (see _get_messages_index)
+        self._messages_index: Optional[Dict[str, Path]] = None
+
+        # Messages of channels being downloaded, per channel ID: every known message and
+        # its timestamp, plus the new messages not yet appended to the JSONL file
+        self._channel_buffers: Dict[str, Dict[str, Any]] = {}
+        atexit.register(self._flush_channel_buffers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Save buffered messages and the message summary, stop the file download pool and close the shared HTTP session"""
+        self._flush_channel_buffers()
+        self._flush_message_summary()
+        # Both are flushed now; the exit hooks would otherwise keep this instance alive
+        atexit.unregister(self._flush_channel_buffers)
+        atexit.unregister(self._flush_message_summary)
+        with self._file_executor_lock:
+            if self._file_executor is not None:
+                self._file_executor.shutdown(wait=True, **_SHUTDOWN_OPTIONS)
+                self._file_executor = None
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+
+    def _get_file_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool shared by all file downloads, so concurrency is bounded across channels"""
+        with self._file_executor_lock:
+            if self._file_executor is None:
+                self._file_executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_concurrent_file_downloads, thread_name_prefix="file-download"
+                )
+            return self._file_executor
+
+    def _submit_file_download(self, file_info: Dict[str, Any], channel_name: str) -> Future:
+        """Start downloading a file, or return the download already in flight for the same file ID"""
+        executor = self._get_file_executor()
+        file_id = file_info.get("id")
+        if not file_id:
+            return executor.submit(self._download_file, file_info, channel_name)
+
+        with self._file_downloads_lock:
+            future = self._file_downloads.get(file_id)
+            if future is not None:
+                return future
+            future = self._file_downloads[file_id] = executor.submit(self._download_file, file_info, channel_name)
+
+        # Once finished, later requests are answered from downloaded_files instead
+        # (registered outside the lock: the callback runs right away if the download is already done)
+        future.add_done_callback(lambda done: self._forget_file_download(file_id, done))
+        return future
+
+    def _forget_file_download(self, file_id: str, future: Future):
+        """Drop a finished download from the in-flight table"""
+        with self._file_downloads_lock:
+            if self._file_downloads.get(file_id) is future:
+                del self._file_downloads[file_id]
+
+    def _get_http_session(self) -> requests.Session:
+        """Get the shared HTTP session, so file downloads reuse keep-alive connections"""
+        if self._http_session is None:
+            session = requests.Session()
+            session.headers["User-Agent"] = "SlackMigrator/1.0"
+            # Keep one pooled connection per download thread, and retry throttled or
+            # failed requests honouring Retry-After
+            retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                          respect_retry_after_header=True, raise_on_status=False)
+            pool_size = max(self.config.max_concurrent_file_downloads, 10)
+            session.mount("https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry))
+            self._http_session = session
+        return self._http_session
+
     def _workspace_info_exists(self) -> bool:
         """Check if workspace info is already downloaded"""
         return (self.output_dir / "workspace_info.json").exists()
@@ -73,17 +227,62 @@ class SlackMigrator:
         """Check if channels data is already downloaded"""
         return (self.output_dir / "channels.json").exists()
 
+    def _get_messages_index(self) -> Dict[str, Path]:
+        """Map channel IDs to their message files, reading the messages directory only once"""
+        if self._messages_index is None:
+            index = {}
+            if self.messages_dir.exists():
+                with os.scandir(self.messages_dir) as entries:
+                    for entry in entries:
+                        # Channel files are named {channel_name}_{channel_id}.json
+                        stem, ext = os.path.splitext(entry.name)
+                        _, separator, channel_id = stem.rpartition("_")
+                        if ext == ".json" and separator:
+                            index[channel_id] = Path(entry.path)
+            self._messages_index = index
+        return self._messages_index
+
+    def _get_dest_channels_cached(self, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Destination channels keyed by name, listed only once unless force is set"""
+        if force or self._dest_channels_cache is None:
+            self._dest_channels_cache = self.dest_client.get_channels()
+            self._dest_channels_by_name = {channel["name"]: channel
+                                           for channel in self._dest_channels_cache
+                                           if "name" in channel}
+        return self._dest_channels_by_name
+
+    def _remember_dest_channel(self, channel: Dict[str, Any]):
+        """Add a newly created destination channel to the cache"""
+        self._get_dest_channels_cached()
+        self._dest_channels_cache.append(channel)
+        self._dest_channels_by_name[channel["name"]] = channel
+
+    def _rebuild_downloaded_files_index(self):
+        """Restore downloaded_files from every saved channel file, so a resumed run skips finished downloads"""
+        with self._downloaded_files_lock:
+            if self._downloaded_files_indexed:
+                return
+
+            restored = 0
+            for file_path in self._get_messages_index().values():
+                try:
+                    for file_info in iter_message_file_infos(file_path):
+                        file_id = file_info.get("id")
+                        local_path = file_info.get("local_path")
+                        if (file_id and local_path and file_info.get("download_status") == "success"
+                                and file_id not in self.downloaded_files and Path(local_path).exists()):
+                            self.downloaded_files[file_id] = local_path
+                            restored += 1
+                except Exception as e:
+                    logger.warning(f"Could not read downloaded files from {file_path.name}: {e}")
+
+            if restored:
+                logger.info(f"Restored {restored} downloaded files from saved channel data")
+            self._downloaded_files_indexed = True
+
     def _channel_messages_exist(self, channel_id: str) -> bool:
         """Check if messages for a specific channel are already downloaded"""
-        messages_dir = self.output_dir / "messages"
-        if not messages_dir.exists():
-            return False
-
-        # Look for any file that contains this channel ID
-        for file_path in messages_dir.glob("*_*.json"):
-            if channel_id in file_path.name:
-                return True
-        return False
+        return channel_id in self._get_messages_index()
 
     def _is_channel_accessible(self, channel: Dict[str, Any]) -> tuple[bool, str]:
         """
@@ -193,18 +392,7 @@ class SlackMigrator:
 
     def _get_safe_filename(self, filename: str) -> str:
         """Get a safe filename for saving files"""
-        # Remove or replace unsafe characters
-        unsafe_chars = '<>:"/\\|?*'
-        safe_filename = filename
-        for char in unsafe_chars:
-            safe_filename = safe_filename.replace(char, '_')
-
-        # Limit length to avoid filesystem issues
-        if len(safe_filename) > 200:
-            name, ext = os.path.splitext(safe_filename)
-            safe_filename = name[:200-len(ext)] + ext
-
-        return safe_filename
+        return _safe_filename(filename)
 
     def _download_file(self, file_info: Dict[str, Any], channel_name: str) -> Optional[str]:
         """
@@ -220,11 +408,10 @@ class SlackMigrator:
             return self.downloaded_files[file_id]
 
         # Get download URL - try different URL fields
-        download_url = None
-        for url_field in ["url_private_download", "url_private", "permalink_public"]:
-            if file_info.get(url_field):
-                download_url = file_info[url_field]
-                break
+        download_url = next(
+            (file_info[url_field] for url_field in ("url_private_download", "url_private", "permalink_public") if file_info.get(url_field)),
+            None
+        )
 
         if not download_url:
             logger.warning(f"No download URL found for file {file_id}")
@@ -242,39 +429,57 @@ class SlackMigrator:
 
         # Organize by channel
         channel_files_dir = self.files_dir / channel_name
-        channel_files_dir.mkdir(exist_ok=True)
-
         local_path = channel_files_dir / safe_filename
-
-        # If file already exists, add number suffix
-        counter = 1
-        original_path = local_path
-        while local_path.exists():
-            name_part = original_path.stem
-            ext_part = original_path.suffix
-            local_path = original_path.parent / f"{name_part}_{counter}{ext_part}"
-            counter += 1
+        fd = None
+        local_file = None
 
         try:
+            channel_files_dir.mkdir(exist_ok=True)
+
+            # Claim the file name atomically (safe with parallel downloads); if it is
+            # taken, add a random suffix instead
+            try:
+                fd = os.open(local_path, _NEW_FILE_FLAGS, 0o644)
+            except FileExistsError:
+                local_path = local_path.with_name(f"{local_path.stem}_{uuid.uuid4().hex[:8]}{local_path.suffix}")
+                fd = os.open(local_path, _NEW_FILE_FLAGS, 0o644)
+            local_file = os.fdopen(fd, 'wb')
+
             # Download with authorization header
             headers = {
-                "Authorization": f"Bearer {self.config.source_token}",
-                "User-Agent": "SlackMigrator/1.0"
+                "Authorization": f"Bearer {self.config.source_token}"
             }
 
             logger.debug(f"Downloading file: {file_title} -> {local_path}")
 
-            # Rate limit file downloads (be conservative)
-            time.sleep(1.0)
+            # Rate limit file downloads across all download threads
+            self.source_client.file_bucket.acquire()
 
-            response = requests.get(download_url, headers=headers, stream=True, timeout=30)
+            response = self._get_http_session().get(download_url, headers=headers, stream=True, timeout=30)
             response.raise_for_status()
 
-            # Write file in chunks
-            with open(local_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            # Copy the body to disk in 1 MiB chunks (the copy loop runs in C)
+            with local_file as f:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+                # Reserve space for large files up front so they are not fragmented. Only when the
+                # body is not content-encoded, since Content-Length is then the size on disk.
+                content_length = int(response.headers.get("Content-Length") or 0)
+                preallocated = False
+                if (hasattr(os, "posix_fallocate") and content_length >= PREALLOCATE_MIN_SIZE
+                        and "Content-Encoding" not in response.headers):
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, content_length)
+                        preallocated = True
+                    except OSError:
+                        pass  # Not supported by this file system
+
+                response.raw.decode_content = True  # Same decoding iter_content() would apply
+                shutil.copyfileobj(response.raw, f, length=FILE_COPY_CHUNK_SIZE)
+
+                if preallocated:
+                    f.truncate()  # Drop reserved space a short body did not fill
 
             file_size = local_path.stat().st_size
             logger.info(f"Downloaded {file_title} ({file_size} bytes) to {local_path}")
@@ -286,82 +491,97 @@ class SlackMigrator:
 
         except Exception as e:
             logger.error(f"Failed to download file {file_title}: {e}")
-            # Clean up partial file
-            if local_path.exists():
-                local_path.unlink()
+            # Clean up the partial file, but only if this download created it
+            if local_file is not None:
+                local_file.close()
+            elif fd is not None:
+                os.close(fd)
+            if fd is not None:
+                local_path.unlink(missing_ok=True)
             return None
 
-    def _process_message_files(self, message: Dict[str, Any], channel_name: str) -> Dict[str, Any]:
+    def _process_message_files(self, message: Dict[str, Any], local_paths: Dict[int, Optional[str]]) -> Dict[str, Any]:
         """
-        Process and download files from a message
-        Returns updated message with local file paths
+        Apply download results to the files of a message, in place
+        local_paths maps file index -> local path (None if the download failed);
+        files without an entry were already downloaded and are kept as they are.
+        Returns the same message, now with local file paths
         """
-        if "files" not in message:
-            return message
-
         files = message["files"]
-        if not files:
-            return message
-
-        updated_files = []
-
-        for file_info in files:
-            # Check if file is already downloaded and still exists
-            if (file_info.get("local_path") and
-                file_info.get("download_status") == "success" and
-                Path(file_info["local_path"]).exists()):
-
-                # File already downloaded and verified - skip download
-                updated_file_info = file_info.copy()
-                updated_file_info["_was_already_downloaded"] = True  # Temporary flag for counting
-                logger.debug(f"Skipping already downloaded file: {file_info.get('name', 'unknown')}")
-                updated_files.append(updated_file_info)
-                continue
-
-            # Download the file (either new or needs re-download)
-            local_path = self._download_file(file_info, channel_name)
-
-            # Create updated file info
-            updated_file_info = file_info.copy()
+        for file_idx, local_path in local_paths.items():
+            file_info = files[file_idx]
             if local_path:
-                updated_file_info["local_path"] = local_path
-                updated_file_info["download_status"] = "success"
+                file_info["local_path"] = local_path
+                file_info["download_status"] = "success"
             else:
-                updated_file_info["download_status"] = "failed"
+                file_info["download_status"] = "failed"
 
-            updated_files.append(updated_file_info)
+        return message
 
-        # Update message with new file info
-        updated_message = message.copy()
-        updated_message["files"] = updated_files
+    def _apply_file_results(self, messages: List[Dict[str, Any]],
+                            local_paths: Dict[int, Dict[int, Optional[str]]]) -> List[Dict[str, Any]]:
+        """Apply file download results to messages in place and return the same list"""
+        for message_idx, message_paths in local_paths.items():
+            self._process_message_files(messages[message_idx], message_paths)
+        return messages
 
-        return updated_message
+    def _prefetch_channel_files(self, messages: List[Dict[str, Any]], channel_name: str,
+                                prefetched: Dict[str, Future]):
+        """
+        Start downloading the files of a batch of messages while the rest of the history is fetched
+        Futures are recorded in prefetched by Slack file ID, for _download_channel_files
+        """
+        for message in messages:
+            for file_info in message.get("files") or ():
+                file_id = file_info.get("id")
+                if file_id and file_info.get("download_status") != "success" and file_id not in prefetched:
+                    prefetched[file_id] = self._submit_file_download(file_info, channel_name)
 
-    def _download_channel_files(self, messages: List[Dict[str, Any]], channel_name: str) -> List[Dict[str, Any]]:
+    def _download_channel_files(self, messages: List[Dict[str, Any]], channel_name: str,
+                                prefetched: Optional[Dict[str, Future]] = None) -> List[Dict[str, Any]]:
         """
         Download all files from messages in a channel
+        prefetched holds downloads already started by _prefetch_channel_files
         Returns updated messages with local file paths
         """
         if not messages:
             return messages
+        prefetched = prefetched or {}
 
-        # Count files that need downloading (skip already downloaded files)
-        total_files = 0
+        # Collect the files that need downloading in one pass (skip already downloaded files)
+        file_tasks = []  # (message index, file index, file info)
         files_already_downloaded = 0
 
-        for message in messages:
-            if "files" in message and message["files"]:
-                for file_info in message["files"]:
-                    if file_info.get("local_path") and file_info.get("download_status") == "success":
-                        # File already downloaded - verify it still exists
-                        if Path(file_info["local_path"]).exists():
-                            files_already_downloaded += 1
-                            continue
-                        else:
-                            # File was downloaded before but no longer exists - needs re-download
-                            file_info.pop("local_path", None)
-                            file_info.pop("download_status", None)
-                    total_files += 1
+        # Download results, keyed by message index then file index
+        local_paths: Dict[int, Dict[int, Optional[str]]] = {}
+
+        for message_idx, message in enumerate(messages):
+            for file_idx, file_info in enumerate(message.get("files") or ()):
+                if file_info.get("local_path") and file_info.get("download_status") == "success":
+                    # File already downloaded - verify it still exists
+                    if Path(file_info["local_path"]).exists():
+                        files_already_downloaded += 1
+                        continue
+                    else:
+                        # File was downloaded before but no longer exists - needs re-download
+                        file_info.pop("local_path", None)
+                        file_info.pop("download_status", None)
+
+                # Download already started while the history was being fetched
+                if file_info.get("id") in prefetched:
+                    file_tasks.append((message_idx, file_idx, file_info))
+                    continue
+
+                # Downloaded earlier for another message or channel - reuse it without a task
+                cached_path = self.downloaded_files.get(file_info.get("id"))
+                if cached_path and Path(cached_path).exists():
+                    local_paths.setdefault(message_idx, {})[file_idx] = cached_path
+                    files_already_downloaded += 1
+                    continue
+
+                file_tasks.append((message_idx, file_idx, file_info))
+
+        total_files = len(file_tasks)
 
         if total_files == 0 and files_already_downloaded == 0:
             return messages
@@ -373,36 +593,32 @@ class SlackMigrator:
 
         if total_files == 0:
             logger.info(f"All files already downloaded for #{channel_name}, skipping file download phase")
-            return messages
+            return self._apply_file_results(messages, local_paths)
 
-        updated_messages = []
+        # Download files concurrently
         downloaded_count = 0
         failed_count = 0
-        skipped_count = 0
+
+        # The same file can be attached to several messages (or be downloading for another
+        # channel), so one future may fill several slots
+        futures: Dict[Future, List[Tuple[int, int]]] = {}
+        for message_idx, file_idx, file_info in file_tasks:
+            future = prefetched.get(file_info.get("id")) or self._submit_file_download(file_info, channel_name)
+            futures.setdefault(future, []).append((message_idx, file_idx))
 
         with tqdm(total=total_files, desc=f"Downloading files from #{channel_name}") as pbar:
-            for message in messages:
-                if "files" in message and message["files"]:
-                    # Process message files, but skip already downloaded ones
-                    updated_message = self._process_message_files(message, channel_name)
-
-                    # Count results
-                    for file_info in updated_message.get("files", []):
-                        if file_info.get("download_status") == "success":
-                            if file_info.get("_was_already_downloaded"):
-                                skipped_count += 1
-                                # Don't update progress bar for skipped files
-                                file_info.pop("_was_already_downloaded", None)  # Clean up temp flag
-                            else:
-                                downloaded_count += 1
-                                pbar.update(1)
-                        elif file_info.get("download_status") == "failed":
-                            failed_count += 1
-                            pbar.update(1)
+            for future in as_completed(futures):
+                local_path = future.result()
+                for message_idx, file_idx in futures[future]:
+                    local_paths.setdefault(message_idx, {})[file_idx] = local_path
+                    if local_path:
+                        downloaded_count += 1
+                    else:
+                        failed_count += 1
+                    pbar.update(1)
 
-                    updated_messages.append(updated_message)
-                else:
-                    updated_messages.append(message)
+        updated_messages = self._apply_file_results(messages, local_paths)
+        skipped_count = files_already_downloaded
 
         summary_parts = [f"{downloaded_count} successful"]
         if failed_count > 0:
@@ -417,16 +633,14 @@ class SlackMigrator:
         """Download workspace info if not already present"""
         if not force and self._workspace_info_exists():
             logger.info("Workspace info already exists, skipping download")
-            with open(self.output_dir / "workspace_info.json", "r") as f:
-                return json.load(f)
+            return load_json(self.output_dir / "workspace_info.json")
 
         logger.info("Downloading workspace info...")
         try:
             workspace_info = self.source_client.get_workspace_info()
 
             # Save immediately
-            with open(self.output_dir / "workspace_info.json", "w") as f:
-                json.dump(workspace_info, f, indent=2)
+            dump_json(self.output_dir / "workspace_info.json", workspace_info)
 
             logger.info("Workspace info downloaded and saved")
             return workspace_info
@@ -438,16 +652,14 @@ class SlackMigrator:
         """Download users data if not already present"""
         if not force and self._users_data_exists():
             logger.info("Users data already exists, skipping download")
-            with open(self.output_dir / "users.json", "r") as f:
-                return json.load(f)
+            return load_json(self.output_dir / "users.json")
 
         logger.info("Downloading users...")
         try:
             users = self.source_client.get_users()
 
             # Save immediately
-            with open(self.output_dir / "users.json", "w") as f:
-                json.dump(users, f, indent=2)
+            dump_json(self.output_dir / "users.json", users)
 
             logger.info(f"Downloaded and saved {len(users)} users")
             return users
@@ -459,16 +671,14 @@ class SlackMigrator:
         """Download channels data if not already present"""
         if not force and self._channels_data_exists():
             logger.info("Channels data already exists, skipping download")
-            with open(self.output_dir / "channels.json", "r") as f:
-                return json.load(f)
+            return load_json(self.output_dir / "channels.json")
 
         logger.info("Downloading channels...")
         try:
             channels = self.source_client.get_channels()
 
             # Save immediately
-            with open(self.output_dir / "channels.json", "w") as f:
-                json.dump(channels, f, indent=2)
+            dump_json(self.output_dir / "channels.json", channels)
 
             logger.info(f"Downloaded and saved {len(channels)} channels")
             return channels
@@ -476,14 +686,16 @@ class SlackMigrator:
             logger.error(f"Failed to download channels: {e}")
             return None
 
-    def download_workspace_data(self, force: bool = False, enable_archive_download: bool = False) -> Dict[str, Any]:
+    def download_workspace_data(self, force: bool = False, enable_archive_download: bool = False, workers: int = 1) -> Dict[str, Any]:
         """Download all data from source workspace with incremental saving
 
         Args:
             force: Force re-download even if cached data exists
             enable_archive_download: Enable downloading from archived channels by temporarily unarchiving them
+            workers: Number of channels to download in parallel
         """
         logger.info("Starting workspace data download...")
+        self._rebuild_downloaded_files_index()
 
         data = {
             "workspace_info": None,
@@ -551,111 +763,120 @@ class SlackMigrator:
                     })
 
                 # Download each channel with time-based progress
-                for i, channel_data in enumerate(channels_with_time):
-                    channel = channel_data["channel"]
-                    time_to_rest = channel_data["time_to_rest"]
+                jobs = [
+                    (channel_data["channel"], channel_data["time_to_rest"], ts_now, f"{i+1}/{len(channels_with_time)}")
+                    for i, channel_data in enumerate(channels_with_time)
+                ]
+
+                if workers > 1:
+                    # Channels run concurrently and share the clients' rate limits
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = [executor.submit(self._download_one_channel, *job) for job in jobs]
+                        try:
+                            for future in as_completed(futures):
+                                channel_id, channel_result = future.result()
+                                if channel_result is not None:
+                                    data["messages"][channel_id] = channel_result
+                        except KeyboardInterrupt:
+                            # Channels already in progress finish saving; queued ones are dropped
+                            for future in futures:
+                                future.cancel()
+                            raise
+                else:
+                    for job in jobs:
+                        channel_id, channel_result = self._download_one_channel(*job)
+                        if channel_result is not None:
+                            data["messages"][channel_id] = channel_result
+                        time.sleep(1)  # Brief pause between channels
 
-                    channel_name = channel.get("name", "unknown")
-                    channel_id = channel["id"]
-                    was_archived = channel.get("was_originally_archived", False)
+        finally:
+            # Re-archive any channels that were temporarily unarchived
+            for channel in channels_to_rearchive:
+                self._rearchive_channel(channel)
 
-                    print(f"{i+1}/{len(channels_with_time)}: {channel_name}")
+        self._flush_message_summary()
+        logger.info("Workspace download completed")
+        return data
 
-                    # Create time-based progress bar
-                    pbar = tqdm(total=time_to_rest, desc=f"#{channel_name}")
+    def _download_one_channel(self, channel: Dict[str, Any], time_to_rest: int, ts_now: int,
+                              position: str) -> tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Download the messages and files of one channel for download_workspace_data
+        Returns (channel_id, channel data), where the data is None if nothing was saved
+        """
+        channel_name = channel.get("name", "unknown")
+        channel_id = channel["id"]
+        was_archived = channel.get("was_originally_archived", False)
 
-                    try:
-                        # Create progress callback for incremental saving
-                        def save_progress(message_batch: List[Dict[str, Any]]):
-                            if message_batch:
-                                self._save_incremental_messages(channel_name, channel_id, message_batch, channel, is_complete=False)
-
-                        # Download messages with time-based progress
-                        messages = self.source_client.get_channel_messages(
-                            channel_id,
-                            include_thread_replies=True,
-                            progress_callback=save_progress,
-                            ts_progress_bar=pbar,
-                            ts_now=ts_now
-                        )
+        print(f"{position}: {channel_name}")
 
-                        # Ensure progress bar reaches 100%
-                        pbar.update(time_to_rest - pbar.n)
+        # Create time-based progress bar
+        pbar = tqdm(total=time_to_rest, desc=f"#{channel_name}")
 
-                        # Process files
-                        logger.info(f"Processing files for #{channel_name}...")
-                        updated_messages = self._download_channel_files(messages, channel_name)
+        try:
+            # Create progress callback for incremental saving; each batch's files start
+            # downloading right away, overlapping with the rest of the history fetch
+            prefetched: Dict[str, Future] = {}
 
-                        # Final save with completion flag
-                        final_save_data = {
-                            "channel_info": channel,
-                            "messages": updated_messages,
-                            "download_timestamp": datetime.now().isoformat(),
-                            "files_downloaded": True,
-                            "download_completed": True,
-                            "was_archived": was_archived
-                        }
-                        self._save_incremental_messages(channel_name, channel_id, [], final_save_data)
+            def save_progress(message_batch: List[Dict[str, Any]]):
+                if message_batch:
+                    self._save_incremental_messages(channel_name, channel_id, message_batch, channel, is_complete=False)
+                    self._prefetch_channel_files(message_batch, channel_name, prefetched)
+
+            # Download messages with time-based progress
+            messages = self.source_client.get_channel_messages(
+                channel_id,
+                include_thread_replies=True,
+                progress_callback=save_progress,
+                ts_progress_bar=pbar,
+                ts_now=ts_now
+            )
 
-                        data["messages"][channel_id] = final_save_data
-                        archive_indicator = " 📦" if was_archived else ""
-                        logger.info(f"✅ Completed #{channel_name}: {len(updated_messages)} messages{archive_indicator}")
+            # Ensure progress bar reaches 100%
+            pbar.update(time_to_rest - pbar.n)
+
+            # Process files
+            logger.info(f"Processing files for #{channel_name}...")
+            updated_messages = self._download_channel_files(messages, channel_name, prefetched)
+
+            # Final save with completion flag
+            final_save_data = {
+                "channel_info": channel,
+                "messages": updated_messages,
+                "download_timestamp": datetime.now().isoformat(),
+                "files_downloaded": True,
+                "download_completed": True,
+                "was_archived": was_archived
+            }
+            self._save_channel_data(channel_name, channel_id, final_save_data)
 
-                    except Exception as e:
-                        logger.error(f"❌ Failed to download #{channel_name}: {e}")
-                        # Mark partial completion
-                        existing_data = self._load_existing_channel_data(channel_name, channel_id)
-                        if existing_data.get("messages"):
-                            data["messages"][channel_id] = {
-                                **existing_data,
-                                "partial_download": True,
-                                "download_completed": False
-                            }
-                    finally:
-                        pbar.close()
-                        time.sleep(1)  # Brief pause between channels
+            archive_indicator = " 📦" if was_archived else ""
+            logger.info(f"✅ Completed #{channel_name}: {len(updated_messages)} messages{archive_indicator}")
+            return channel_id, final_save_data
 
+        except Exception as e:
+            logger.error(f"❌ Failed to download #{channel_name}: {e}")
+            # Mark partial completion in the channel file
+            self._save_partial_channel_data(channel_id)
+            existing_data = self._load_existing_channel_data(channel_name, channel_id)
+            if existing_data.get("messages"):
+                return channel_id, {
+                    **existing_data,
+                    "partial_download": True,
+                    "download_completed": False
+                }
+            return channel_id, None
         finally:
-            # Re-archive any channels that were temporarily unarchived
-            for channel in channels_to_rearchive:
-                self._rearchive_channel(channel)
-
-        logger.info("Workspace download completed")
-        return data
+            pbar.close()
 
     def _load_existing_channel_data(self, channel_name: str, channel_id: str) -> Dict[str, Any]:
-        """Load existing channel data if it exists"""
-        messages_dir = self.output_dir / "messages"
+        """Load existing channel data if it exists, including messages of an unfinished download"""
+        messages_dir = self.messages_dir
         filename = f"{channel_name}_{channel_id}.json"
         file_path = messages_dir / filename
+        pending_path = messages_dir / f"{channel_name}_{channel_id}.messages.jsonl"
 
-        if file_path.exists():
-            try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
-
-                    # Populate downloaded_files cache from existing message data to prevent re-downloads
-                    messages = data.get("messages", [])
-                    for message in messages:
-                        for file_info in message.get("files", []):
-                            file_id = file_info.get("id")
-                            local_path = file_info.get("local_path")
-                            if file_id and local_path and file_info.get("download_status") == "success":
-                                # Verify file still exists on disk
-                                if Path(local_path).exists():
-                                    self.downloaded_files[file_id] = local_path
-                                    logger.debug(f"Restored file cache entry: {file_id} -> {local_path}")
-                                else:
-                                    logger.warning(f"Previously downloaded file missing: {local_path}")
-
-                    if self.downloaded_files:
-                        logger.info(f"Restored {len(self.downloaded_files)} file download entries from cache")
-
-                    return data
-            except Exception as e:
-                logger.warning(f"Could not load existing channel data: {e}")
-
-        return {
+        data = {
             "channel_info": {},
             "messages": [],
             "download_timestamp": None,
@@ -663,56 +884,214 @@ class SlackMigrator:
             "download_completed": False
         }
 
-    def _save_incremental_messages(self, channel_name: str, channel_id: str, new_messages: List[Dict[str, Any]],
-                                 channel_info: Dict[str, Any], is_complete: bool = False):
-        """Save messages incrementally to avoid data loss on interruption"""
-        messages_dir = self.output_dir / "messages"
-        messages_dir.mkdir(exist_ok=True)
-        filename = f"{channel_name}_{channel_id}.json"
-        file_path = messages_dir / filename
+        if file_path.exists():
+            try:
+                data = load_json(file_path)
+            except Exception as e:
+                logger.warning(f"Could not load existing channel data: {e}")
 
-        # Load existing data
-        existing_data = self._load_existing_channel_data(channel_name, channel_id)
+        # Merge messages saved by an in-progress (or interrupted) download
+        if pending_path.exists():
+            try:
+                messages = data.setdefault("messages", [])
+                known_timestamps = {msg.get("ts") for msg in messages}
+                for message in load_json_lines(pending_path):
+                    if message.get("ts") not in known_timestamps:
+                        messages.append(message)
+                        known_timestamps.add(message.get("ts"))
+                messages.sort(key=lambda x: float(x.get("ts", 0)))
+            except Exception as e:
+                logger.warning(f"Could not load in-progress messages: {e}")
 
-        # Update channel info
-        existing_data["channel_info"] = channel_info
+        # Populate downloaded_files cache from existing message data to prevent re-downloads
+        for message in data.get("messages", []):
+            for file_info in message.get("files", []):
+                file_id = file_info.get("id")
+                local_path = file_info.get("local_path")
+                if file_id and local_path and file_info.get("download_status") == "success":
+                    # Verify file still exists on disk
+                    if Path(local_path).exists():
+                        self.downloaded_files[file_id] = local_path
+                        logger.debug(f"Restored file cache entry: {file_id} -> {local_path}")
+                    else:
+                        logger.warning(f"Previously downloaded file missing: {local_path}")
 
-        # Append new messages (avoid duplicates by timestamp)
-        existing_messages = existing_data.get("messages", [])
-        existing_timestamps = {msg.get("ts") for msg in existing_messages if msg.get("ts")}
+        if self.downloaded_files:
+            logger.info(f"Restored {len(self.downloaded_files)} file download entries from cache")
 
-        for message in new_messages:
-            if message.get("ts") not in existing_timestamps:
-                existing_messages.append(message)
-                existing_timestamps.add(message.get("ts"))
+        return data
 
-        # Sort messages by timestamp (oldest first)
-        existing_messages.sort(key=lambda x: float(x.get("ts", 0)))
+    def _get_channel_buffer(self, channel_name: str, channel_id: str, channel_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the in-memory message buffer for a channel, seeded from disk on first use"""
+        buffer = self._channel_buffers.get(channel_id)
+        if buffer is None:
+            messages = self._load_existing_channel_data(channel_name, channel_id).get("messages", [])
+            buffer = self._channel_buffers[channel_id] = {
+                "channel_name": channel_name,
+                "channel_info": channel_info,
+                "messages": messages,
+                "seen_ts": {msg.get("ts") for msg in messages},
+                "pending": [],
+                "sorted": True,
+                "changed": False  # Whether messages were added since the channel file was written
+            }
+        return buffer
 
-        # Update the data
-        existing_data["messages"] = existing_messages
-        existing_data["last_update_timestamp"] = datetime.now().isoformat()
-        existing_data["download_completed"] = is_complete
+    def _flush_channel_buffer(self, channel_id: str):
+        """Append a channel's buffered new messages to its JSONL file"""
+        buffer = self._channel_buffers.get(channel_id)
+        if not buffer or not buffer["pending"]:
+            return
 
-        # Save to file
+        self.messages_dir.mkdir(exist_ok=True)
+        pending_path = self.messages_dir / f"{buffer['channel_name']}_{channel_id}.messages.jsonl"
         try:
-            with open(file_path, "w") as f:
-                json.dump(existing_data, f, indent=2)
-            logger.debug(f"Saved {len(new_messages)} new messages to {filename} (total: {len(existing_messages)})")
+            append_json_lines(pending_path, buffer["pending"])
+            logger.debug(f"Saved {len(buffer['pending'])} new messages for #{buffer['channel_name']} (total: {len(buffer['messages'])})")
+            buffer["pending"] = []
         except Exception as e:
             logger.error(f"Failed to save incremental messages: {e}")
 
+    def _flush_channel_buffers(self):
+        """Save every unfinished channel as a partial download (also run at interpreter exit)"""
+        for channel_id in list(self._channel_buffers):
+            self._save_partial_channel_data(channel_id)
+
+    def _save_partial_channel_data(self, channel_id: str):
+        """Compact an unfinished download into the channel's JSON file, marked as partial
+
+        Everything that reads the messages directory only looks at *.json files, so a
+        channel whose download failed or was interrupted stays visible this way. The
+        JSONL file is kept instead if the JSON file cannot be written.
+        """
+        buffer = self._channel_buffers.get(channel_id)
+        if buffer is None:
+            return
+        if not buffer["changed"]:
+            # Nothing new since the channel file was loaded; leave it as it is
+            self._channel_buffers.pop(channel_id, None)
+            return
+
+        channel_name = buffer["channel_name"]
+        channel_data = {
+            "channel_info": buffer["channel_info"],
+            "messages": self._get_channel_messages(channel_name, channel_id),
+            "last_update_timestamp": datetime.now().isoformat(),
+            "download_completed": False,
+            "partial_download": True
+        }
+        self._save_channel_data(channel_name, channel_id, channel_data)
+        if channel_id in self._channel_buffers:
+            self._flush_channel_buffer(channel_id)
+
+    def _get_channel_messages(self, channel_name: str, channel_id: str) -> List[Dict[str, Any]]:
+        """Get all known messages of a channel sorted by timestamp, from memory when buffered"""
+        buffer = self._channel_buffers.get(channel_id)
+        if buffer is None:
+            return self._load_existing_channel_data(channel_name, channel_id).get("messages", [])
+
+        if not buffer["sorted"]:
+            buffer["messages"].sort(key=lambda x: float(x.get("ts", 0)))
+            buffer["sorted"] = True
+        return buffer["messages"]
+
+    def _save_incremental_messages(self, channel_name: str, channel_id: str, new_messages: List[Dict[str, Any]],
+                                 channel_info: Dict[str, Any], is_complete: bool = False):
+        """Save messages incrementally to avoid data loss on interruption
+
+        New messages are kept in memory and appended to a {channel}_{id}.messages.jsonl
+        file once batch_size of them have accumulated. With is_complete=True they are
+        merged into the channel's JSON file in one compaction pass.
+        """
+        buffer = self._get_channel_buffer(channel_name, channel_id, channel_info)
+        seen_ts = buffer["seen_ts"]
+
+        # Append new messages (avoid duplicates by timestamp)
+        for message in new_messages:
+            if message.get("ts") not in seen_ts:
+                buffer["messages"].append(message)
+                buffer["pending"].append(message)
+                seen_ts.add(message.get("ts"))
+                buffer["sorted"] = False
+                buffer["changed"] = True
+
+        if is_complete:
+            channel_data = {
+                "channel_info": channel_info,
+                "messages": self._get_channel_messages(channel_name, channel_id),
+                "last_update_timestamp": datetime.now().isoformat(),
+                "download_completed": True
+            }
+            self._save_channel_data(channel_name, channel_id, channel_data)
+        elif len(buffer["pending"]) >= self.config.batch_size:
+            self._flush_channel_buffer(channel_id)
+
+    def _save_channel_data(self, channel_name: str, channel_id: str, channel_data: Dict[str, Any]):
+        """Write the final JSON file for a channel and drop its in-progress messages file"""
+        messages_dir = self.messages_dir
+        messages_dir.mkdir(exist_ok=True)
+        filename = f"{channel_name}_{channel_id}.json"
+        file_path = messages_dir / filename
+
+        try:
+            dump_json(file_path, channel_data, fsync=True)
+            if self._messages_index is not None:
+                self._messages_index[channel_id] = file_path
+            logger.debug(f"Saved {len(channel_data.get('messages', []))} messages to {filename}")
+            self._update_message_summary(file_path, channel_data)
+        except Exception as e:
+            logger.error(f"Failed to save channel data: {e}")
+            return
+
+        # Everything buffered or in the pending file is now part of the JSON file
+        (messages_dir / f"{channel_name}_{channel_id}.messages.jsonl").unlink(missing_ok=True)
+        self._channel_buffers.pop(channel_id, None)
+
+    def _update_message_summary(self, file_path: Path, channel_data: Dict[str, Any]):
+        """Record the counts for a just-written channel file so `status` does not have to re-parse it
+
+        The entry is kept in memory until _flush_message_summary() writes the summary file.
+        """
+        messages = channel_data.get("messages", [])
+        entry = message_summary_entry(
+            file_path, len(messages), count_message_files(messages), bool(channel_data.get("error"))
+        )
+        with self._summary_lock:
+            self._pending_summary[file_path.name] = entry
+
+    def _flush_message_summary(self):
+        """Write the summary entries collected by _update_message_summary in a single update"""
+        with self._summary_lock:
+            if not self._pending_summary:
+                return
+            summary = load_message_summary(self.output_dir)
+            summary.update(self._pending_summary)
+            save_message_summary(self.output_dir, summary)
+            self._pending_summary.clear()
+
     def _get_last_message_timestamp(self, channel_name: str, channel_id: str) -> Optional[str]:
-        """Get the timestamp of the last downloaded message for resuming"""
-        existing_data = self._load_existing_channel_data(channel_name, channel_id)
-        messages = existing_data.get("messages", [])
+        """Get the timestamp of the last downloaded message for resuming
 
-        if messages:
-            # Messages should be sorted by timestamp, get the newest one
-            latest_message = max(messages, key=lambda x: float(x.get("ts", 0)))
-            return latest_message.get("ts")
+        Only the timestamps are read: from memory while the channel is buffered,
+        otherwise streamed from the channel file and its in-progress JSONL file.
+        """
+        buffer = self._channel_buffers.get(channel_id)
+        if buffer is not None:
+            timestamps = buffer["seen_ts"]
+        else:
+            file_path = self.messages_dir / f"{channel_name}_{channel_id}.json"
+            pending_path = self.messages_dir / f"{channel_name}_{channel_id}.messages.jsonl"
+            timestamps = []
+            try:
+                if file_path.exists():
+                    timestamps.extend(iter_message_timestamps(file_path))
+                if pending_path.exists():
+                    timestamps.extend(message.get("ts") for message in load_json_lines(pending_path))
+            except Exception as e:
+                logger.warning(f"Could not read message timestamps for #{channel_name}: {e}")
+                return None
 
-        return None
+        return max((ts for ts in timestamps if ts), key=float, default=None)
 
     def download_single_channel(self, channel_name: str, force: bool = False, enable_archive_download: bool = False, update: bool = False) -> Optional[Dict[str, Any]]:
         """Download data from a single channel by name with incremental saving
@@ -724,24 +1103,20 @@ class SlackMigrator:
             update: Check for and download new messages from completed channels
         """
         logger.info(f"Starting single channel download for #{channel_name}...")
+        self._rebuild_downloaded_files_index()
 
-        # Ensure workspace info and users are downloaded first
-        workspace_info = self._download_workspace_info(force=force)
-        users = self._download_users_data(force=force)
+        # Ensure workspace info and users are downloaded first (one thread at a time writes them)
+        with self._prerequisites_lock:
+            workspace_info = self._download_workspace_info(force=force)
+            users = self._download_users_data(force=force)
 
         if not workspace_info or not users:
             logger.error("Failed to download required workspace info or users data")
             return None
 
-        # Get all channels to find the target channel (include archived channels for potential unarchiving)
+        # Find the target channel (the index includes archived channels for potential unarchiving)
         logger.info("Finding target channel...")
-        all_channels = self.source_client.get_channels(exclude_archived=False)
-
-        target_channel = None
-        for channel in all_channels:
-            if channel.get("name") == channel_name:
-                target_channel = channel
-                break
+        target_channel = self.source_client.channels_by_name.get(channel_name)
 
         if not target_channel:
             logger.error(f"Channel #{channel_name} not found")
@@ -791,7 +1166,7 @@ class SlackMigrator:
                     # Standard behavior: return cached data
                     logger.info(f"Channel #{channel_name} download already completed, loading from file")
                     messages = existing_data.get("messages", [])
-                    file_count = sum(len(msg.get("files", [])) for msg in messages)
+                    file_count = count_message_files(messages)
 
                     return {
                         "channel_info": target_channel,
@@ -825,7 +1200,7 @@ class SlackMigrator:
                             if not truly_new_messages:
                                 logger.info(f"✅ Channel #{channel_name} is up to date - no new messages found")
                                 messages = existing_data.get("messages", [])
-                                file_count = sum(len(msg.get("files", [])) for msg in messages)
+                                file_count = count_message_files(messages)
 
                                 return {
                                     "channel_info": target_channel,
@@ -842,7 +1217,7 @@ class SlackMigrator:
                                 self._save_incremental_messages(channel_name, channel_id, truly_new_messages, target_channel, is_complete=False)
 
                                 # Get all messages (existing + new) and process files
-                                all_messages = self._load_existing_channel_data(channel_name, channel_id).get("messages", [])
+                                all_messages = self._get_channel_messages(channel_name, channel_id)
 
                                 # Download files only from new messages to avoid re-processing
                                 new_messages_with_files = self._download_channel_files(truly_new_messages, channel_name)
@@ -875,7 +1250,7 @@ class SlackMigrator:
                                     "last_update": datetime.now().isoformat(),
                                     "new_messages_count": len(truly_new_messages)
                                 }
-                                self._save_incremental_messages(channel_name, channel_id, [], final_save_data)
+                                self._save_channel_data(channel_name, channel_id, final_save_data)
 
                                 logger.info(f"✅ Updated #{channel_name} with {len(truly_new_messages)} new messages")
 
@@ -883,7 +1258,7 @@ class SlackMigrator:
                                     "channel_info": target_channel,
                                     "messages": updated_all_messages,
                                     "total_users": len(users),
-                                    "file_count": sum(len(msg.get("files", [])) for msg in updated_all_messages),
+                                    "file_count": count_message_files(updated_all_messages),
                                     "from_cache": False,
                                     "updated": True,
                                     "new_messages_count": len(truly_new_messages)
@@ -893,7 +1268,7 @@ class SlackMigrator:
                             logger.error(f"❌ Error checking for new messages in #{channel_name}: {e}")
                             logger.info("Falling back to returning cached data")
                             messages = existing_data.get("messages", [])
-                            file_count = sum(len(msg.get("files", [])) for msg in messages)
+                            file_count = count_message_files(messages)
 
                             return {
                                 "channel_info": target_channel,
@@ -919,10 +1294,14 @@ class SlackMigrator:
                 if oldest_timestamp:
                     logger.info(f"Resuming download from timestamp {oldest_timestamp}")
 
-            # Create progress callback for incremental saving
+            # Create progress callback for incremental saving; each batch's files start
+            # downloading right away, overlapping with the rest of the history fetch
+            prefetched: Dict[str, Future] = {}
+
             def save_progress(message_batch: List[Dict[str, Any]]):
                 if message_batch:
                     self._save_incremental_messages(channel_name, channel_id, message_batch, target_channel, is_complete=False)
+                    self._prefetch_channel_files(message_batch, channel_name, prefetched)
 
             # Download messages for the target channel with incremental saving
             logger.info(f"Downloading messages from #{channel_name}...")
@@ -948,11 +1327,11 @@ class SlackMigrator:
                     pbar.update(time_to_rest - pbar.n)
 
                     # Mark download as complete
-                    all_messages = self._load_existing_channel_data(channel_name, channel_id).get("messages", [])
+                    all_messages = self._get_channel_messages(channel_name, channel_id)
 
                     # Download files from messages
                     logger.info(f"Processing files for {len(all_messages)} messages...")
-                    updated_messages = self._download_channel_files(all_messages, channel_name)
+                    updated_messages = self._download_channel_files(all_messages, channel_name, prefetched)
 
                     # Final save with file information and completion flag
                     final_save_data = {
@@ -965,7 +1344,7 @@ class SlackMigrator:
                         "partial_download": False,
                         "was_archived": is_archived,  # Track if channel was originally archived
                     }
-                    self._save_incremental_messages(channel_name, channel_id, [], final_save_data)
+                    self._save_channel_data(channel_name, channel_id, final_save_data)
 
                     logger.info(f"✅ Successfully downloaded {len(updated_messages)} messages from #{channel_name}")
 
@@ -1000,8 +1379,8 @@ class SlackMigrator:
                                     # Ensure progress bar reaches 100%
                                     retry_pbar.update(time_to_rest - retry_pbar.n)
 
-                                    all_messages = self._load_existing_channel_data(channel_name, channel_id).get("messages", [])
-                                    updated_messages = self._download_channel_files(all_messages, channel_name)
+                                    all_messages = self._get_channel_messages(channel_name, channel_id)
+                                    updated_messages = self._download_channel_files(all_messages, channel_name, prefetched)
 
                                     final_save_data = {
                                         "channel_info": target_channel,
@@ -1013,7 +1392,7 @@ class SlackMigrator:
                                         "partial_download": False,
                                         "was_archived": is_archived,
                                     }
-                                    self._save_incremental_messages(channel_name, channel_id, [], final_save_data)
+                                    self._save_channel_data(channel_name, channel_id, final_save_data)
 
                                     logger.info(f"✅ Successfully downloaded {len(updated_messages)} messages from #{channel_name} after auto-join")
                                     return final_save_data
@@ -1040,7 +1419,8 @@ class SlackMigrator:
 
             except Exception as e:
                 logger.error(f"❌ Exception downloading #{channel_name}: {e}")
-                # Load partial data if available
+                # Save and load partial data if available
+                self._save_partial_channel_data(channel_id)
                 partial_data = self._load_existing_channel_data(channel_name, channel_id)
                 if partial_data.get("messages"):
                     logger.info(f"⚠️  Returning partial data for #{channel_name}")
@@ -1061,74 +1441,98 @@ class SlackMigrator:
 
         # Save workspace info
         if data.get("workspace_info"):
-            with open(self.output_dir / "workspace_info.json", "w") as f:
-                json.dump(data["workspace_info"], f, indent=2)
+            dump_json(self.output_dir / "workspace_info.json", data["workspace_info"])
 
         # Save users
         if data.get("users"):
-            with open(self.output_dir / "users.json", "w") as f:
-                json.dump(data["users"], f, indent=2)
+            dump_json(self.output_dir / "users.json", data["users"])
 
         # Save channels
         if data.get("channels"):
-            with open(self.output_dir / "channels.json", "w") as f:
-                json.dump(data["channels"], f, indent=2)
+            dump_json(self.output_dir / "channels.json", data["channels"])
 
         # Save messages by channel
         if data.get("messages"):
-            messages_dir = self.output_dir / "messages"
+            messages_dir = self.messages_dir
             messages_dir.mkdir(exist_ok=True)
 
-            for channel_id, channel_data in data["messages"].items():
+            def save_channel(channel_id: str, channel_data: Dict[str, Any]):
                 channel_name = channel_data["channel_info"].get("name", channel_id)
                 filename = f"{channel_name}_{channel_id}.json"
-                with open(messages_dir / filename, "w") as f:
-                    json.dump(channel_data, f, indent=2)
+                dump_json(messages_dir / filename, channel_data)
+                self._update_message_summary(messages_dir / filename, channel_data)
+                if self._messages_index is not None:
+                    self._messages_index[channel_id] = messages_dir / filename
+
+            # Channel files are independent, so encode and write them in parallel
+            with ThreadPoolExecutor(max_workers=min(32, len(data["messages"]))) as executor:
+                list(executor.map(save_channel, data["messages"].keys(), data["messages"].values()))
+            self._flush_message_summary()
 
-    def load_data(self) -> Dict[str, Any]:
-        """Load previously downloaded data from files"""
+    def load_data(self, include_messages: bool = True) -> Dict[str, Any]:
+        """Load previously downloaded data from files
+
+        Args:
+            include_messages: Whether to load every channel's messages into data["messages"].
+                            Pass False and use iter_channel_messages() to read them one channel at a time.
+        """
         logger.info("Loading data from files...")
 
         data = {
             "workspace_info": None,
             "users": [],
             "channels": [],
-            "messages": {}
         }
 
         # Load workspace info
         workspace_file = self.output_dir / "workspace_info.json"
         if workspace_file.exists():
-            with open(workspace_file, "r") as f:
-                data["workspace_info"] = json.load(f)
+            data["workspace_info"] = load_json(workspace_file)
 
         # Load users
         users_file = self.output_dir / "users.json"
         if users_file.exists():
-            with open(users_file, "r") as f:
-                data["users"] = json.load(f)
+            data["users"] = load_json(users_file)
 
         # Load channels
         channels_file = self.output_dir / "channels.json"
         if channels_file.exists():
-            with open(channels_file, "r") as f:
-                data["channels"] = json.load(f)
+            data["channels"] = load_json(channels_file)
+
+        if not include_messages:
+            return data
 
         # Load messages
-        messages_dir = self.output_dir / "messages"
+        data["messages"] = {}
+        messages_dir = self.messages_dir
         if messages_dir.exists():
-            for file_path in messages_dir.glob("*.json"):
-                with open(file_path, "r") as f:
-                    channel_data = json.load(f)
+            # Read and parse the channel files in parallel
+            with ThreadPoolExecutor() as executor:
+                for channel_data in executor.map(load_json, messages_dir.glob("*.json")):
                     channel_id = channel_data["channel_info"]["id"]
                     data["messages"][channel_id] = channel_data
 
         return data
 
+    def iter_channel_messages(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (channel_id, channel_data) for each downloaded channel, loading one file at a time"""
+        if not self.messages_dir.exists():
+            return
+
+        for messages_file in self.messages_dir.glob("*.json"):
+            channel_data = load_json(messages_file)
+            yield channel_data["channel_info"]["id"], channel_data
+
     def upload_workspace_data(self, data: Optional[Dict[str, Any]] = None):
-        """Upload data to destination workspace"""
+        """Upload data to destination workspace
+
+        Without data, the saved files are uploaded one channel at a time, so only a
+        single channel's messages are held in memory.
+        """
+        streamed_messages = None
         if data is None:
-            data = self.load_data()
+            data = self.load_data(include_messages=False)
+            streamed_messages = self.iter_channel_messages()
 
         logger.info("Starting workspace data upload...")
 
@@ -1145,9 +1549,18 @@ class SlackMigrator:
             # For single channel uploads, handle channel creation here
             self._handle_single_channel_creation(data["messages"])
 
-        # Upload messages
+        # Upload messages, reusing the users already loaded (an empty list means none were
+        # loaded, so _upload_messages looks on disk itself and reports when they are missing)
+        users_data = data.get("users") or None
         if "messages" in data:
-            self._upload_messages(data["messages"])
+            self._upload_messages(data["messages"], users_data)
+
+        if streamed_messages is not None:
+            for channel_id, channel_data in streamed_messages:
+                single_channel = {channel_id: channel_data}
+                if not data.get("channels"):
+                    self._handle_single_channel_creation(single_channel)
+                self._upload_messages(single_channel, users_data)
 
         logger.info("Workspace migration completed!")
 
@@ -1185,15 +1598,8 @@ class SlackMigrator:
         logger.info(f"Checking if channel #{channel_name} exists...")
 
         try:
-            # Get existing channels from destination workspace
-            dest_channels = self.dest_client.get_channels()
-
-            # Look for existing channel
-            existing_channel = None
-            for channel in dest_channels:
-                if channel.get("name") == channel_name:
-                    existing_channel = channel
-                    break
+            # Look for existing channel in destination workspace
+            existing_channel = self._get_dest_channels_cached().get(channel_name)
 
             if existing_channel:
                 channel_id = existing_channel["id"]
@@ -1220,6 +1626,7 @@ class SlackMigrator:
                 try:
                     response = self.dest_client.create_channel(channel_name, is_private)
                     new_channel_id = response["channel"]["id"]
+                    self._remember_dest_channel(response["channel"])
                     logger.info(f"Successfully created channel #{channel_name} (ID: {new_channel_id})")
 
                     # Set topic and purpose if they exist
@@ -1278,8 +1685,7 @@ class SlackMigrator:
         """Create channels in destination workspace"""
         logger.info("Creating channels...")
 
-        dest_channels = self.dest_client.get_channels()
-        dest_channel_names = {ch["name"] for ch in dest_channels}
+        dest_channels_by_name = self._get_dest_channels_cached()
 
         for channel in tqdm(source_channels, desc="Creating channels"):
             channel_name = channel.get("name")
@@ -1287,12 +1693,8 @@ class SlackMigrator:
                 continue
 
             # Skip if channel already exists
-            if channel_name in dest_channel_names:
-                # Find the existing channel ID
-                for dest_ch in dest_channels:
-                    if dest_ch["name"] == channel_name:
-                        self.channel_mapping[channel["id"]] = dest_ch["id"]
-                        break
+            if channel_name in dest_channels_by_name:
+                self.channel_mapping[channel["id"]] = dest_channels_by_name[channel_name]["id"]
                 logger.info(f"Channel #{channel_name} already exists, skipping creation")
                 continue
 
@@ -1303,6 +1705,7 @@ class SlackMigrator:
 
                 dest_channel_id = response["channel"]["id"]
                 self.channel_mapping[channel["id"]] = dest_channel_id
+                self._remember_dest_channel(response["channel"])
 
                 logger.info(f"Created channel #{channel_name}")
 
@@ -1320,9 +1723,9 @@ class SlackMigrator:
         logger.info(f"Waiting for file {filename} (ID: {file_id}) to appear in channel...")
 
         start_time = time.time()
-        check_interval = 1.0  # Check every 1 second
+        check_interval = 0.25  # Check right away, then back off: 0.25s, 0.5s, 1s, ...
 
-        while time.time() - start_time < max_wait_time:
+        while True:
             try:
                 # Get recent channel history
                 response = self.dest_client.client.conversations_history(
@@ -1342,12 +1745,15 @@ class SlackMigrator:
                                 logger.info(f"File {filename} successfully posted to channel")
                                 return True
 
-                # Wait before next check
-                time.sleep(check_interval)
-
             except Exception as e:
                 logger.warning(f"Error checking channel history for file {filename}: {e}")
-                time.sleep(check_interval)
+
+            # Wait before next check, but never past the deadline
+            remaining = max_wait_time - (time.time() - start_time)
+            if remaining <= 0:
+                break
+            time.sleep(min(check_interval, remaining))
+            check_interval *= 2
 
         logger.warning(f"Timeout waiting for file {filename} to appear in channel after {max_wait_time}s")
         return False
@@ -1368,9 +1774,15 @@ class SlackMigrator:
             logger.debug(f"Uploading file {original_filename} for permalink")
 
             # Upload file without channel parameter to prevent immediate publishing
-            with open(local_file_path, 'rb') as file_content:
-                response = self.dest_client.client.files_upload_v2(
-                    file=file_content,
+            if os.path.getsize(local_file_path) >= STREAM_UPLOAD_MIN_SIZE:
+                response = self._upload_large_file(local_file_path, original_filename, file_title)
+            else:
+                # Goes through the client's rate limiting and ratelimited retries, which matters
+                # because several files are uploaded in parallel. The file is passed by path
+                # so that a retry reads it again.
+                response = self.dest_client._make_request(
+                    "files_upload_v2",
+                    file=local_file_path,
                     filename=original_filename,
                     title=file_title
                     # Note: No channel parameter - this should keep the file private and get us a permalink
@@ -1393,28 +1805,61 @@ class SlackMigrator:
             logger.error(f"Error uploading file {original_filename} for permalink: {e}")
             return None
 
+    def _upload_large_file(self, local_file_path: str, filename: str, title: str) -> Dict[str, Any]:
+        """Upload a file like files_upload_v2 does, but stream it from disk
+
+        files_upload_v2 reads the whole file into memory first, which is costly for large videos
+        and archives. This runs the same three steps (get an upload URL, send the file, complete the
+        upload without a channel) and returns a response with the uploaded file under "file".
+        """
+        url_response = self.dest_client._make_request(
+            "files_getUploadURLExternal",
+            filename=filename,
+            length=os.path.getsize(local_file_path)
+        )
+
+        # requests sends an open file in chunks, with Content-Length taken from its size
+        with open(local_file_path, 'rb') as file_content:
+            upload_response = self._get_http_session().post(url_response["upload_url"], data=file_content, timeout=300)
+        upload_response.raise_for_status()
+
+        completion = self.dest_client._make_request(
+            "files_completeUploadExternal",
+            files=[{"id": url_response["file_id"], "title": title}]
+        )
+        files = completion.get("files") or []
+        if len(files) == 1:
+            completion["file"] = files[0]
+        return completion
+
     def _format_timestamp_jst(self, slack_timestamp: str) -> str:
         """Convert Slack timestamp to JST formatted string"""
         try:
-            # Slack timestamps are in Unix timestamp format with microseconds
-            timestamp = float(slack_timestamp)
-            dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-            jst_dt = dt.astimezone(self.jst)
-            return jst_dt.strftime("%Y/%m/%d %H:%M:%S JST")
+            # Slack timestamps are in Unix timestamp format with microseconds;
+            # only whole seconds are shown, so they are dropped before the cached lookup
+            return _format_seconds(int(float(slack_timestamp)), self.jst)
         except Exception as e:
             logger.warning(f"Failed to format timestamp {slack_timestamp}: {e}")
             return slack_timestamp
 
-    def _get_user_display_info(self, user_id: str, users_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Get user display information for message posting"""
+    def _build_user_display_info(self, users_data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Map user IDs to the display information used when posting their messages"""
+        users_by_id = {}
         for user in users_data:
-            if user["id"] == user_id:
-                profile = user.get("profile", {})
-                return {
-                    "display_name": profile.get("display_name") or profile.get("real_name") or user.get("name", f"user_{user_id}"),
-                    "icon_url": profile.get("image_72") or profile.get("image_48") or profile.get("image_32"),
-                    "real_name": profile.get("real_name", ""),
-                }
+            user_id = user["id"]
+            profile = user.get("profile", {})
+            users_by_id[user_id] = {
+                "display_name": profile.get("display_name") or profile.get("real_name") or user.get("name", f"user_{user_id}"),
+                "icon_url": profile.get("image_72") or profile.get("image_48") or profile.get("image_32"),
+                "real_name": profile.get("real_name", ""),
+            }
+        return users_by_id
+
+    def _get_user_display_info(self, user_id: str, users_by_id: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Get user display information for message posting"""
+        user_info = users_by_id.get(user_id)
+        if user_info is not None:
+            return user_info
 
         return {
             "display_name": f"user_{user_id}",
@@ -1422,22 +1867,30 @@ class SlackMigrator:
             "real_name": "",
         }
 
-    def _upload_messages(self, messages_data: Dict[str, Any]):
-        """Upload messages to destination channels with enhanced formatting"""
+    def _upload_messages(self, messages_data: Dict[str, Any], users_data: Optional[List[Dict[str, Any]]] = None):
+        """Upload messages to destination channels with enhanced formatting
+
+        Args:
+            messages_data: Channel data keyed by source channel ID
+            users_data: Source users for user info lookup; read from users.json if not given
+        """
         logger.info("Uploading messages with user info and files...")
 
         # Load users data for user info lookup
-        users_data = []
-        users_file = self.output_dir / "users.json"
-        if users_file.exists():
-            try:
-                with open(users_file, "r") as f:
-                    users_data = json.load(f)
-                logger.info(f"Loaded {len(users_data)} users for user info lookup")
-            except Exception as e:
-                logger.warning(f"Failed to load users data: {e}")
-        else:
-            logger.warning("No users data found - user names will show as user IDs")
+        if users_data is None:
+            users_data = []
+            users_file = self.output_dir / "users.json"
+            if users_file.exists():
+                try:
+                    users_data = load_json(users_file)
+                    logger.info(f"Loaded {len(users_data)} users for user info lookup")
+                except Exception as e:
+                    logger.warning(f"Failed to load users data: {e}")
+            else:
+                logger.warning("No users data found - user names will show as user IDs")
+
+        # Look up senders by ID instead of scanning the user list for every message
+        users_by_id = self._build_user_display_info(users_data)
 
         for source_channel_id, channel_data in messages_data.items():
             if source_channel_id not in self.channel_mapping:
@@ -1452,63 +1905,50 @@ class SlackMigrator:
                 logger.info(f"No messages to upload for #{channel_name}")
                 continue
 
-            # Pre-scan to build thread broadcast mapping
-            # Map: message_timestamp -> thread_info from thread_broadcast messages
-            thread_broadcast_info = {}
-            thread_broadcast_count = 0
-            processed_broadcast_timestamps = set()
-
+            # Pre-scan for thread_broadcast messages: the first one with each timestamp is
+            # converted to a thread reply, any later copies are duplicates
+            broadcast_ts = set()
             for message in messages:
                 if message.get("subtype") == "thread_broadcast":
                     msg_ts = message.get("ts")
                     thread_ts = message.get("thread_ts")
                     logger.debug(f"Found thread_broadcast message: ts={msg_ts}, thread_ts={thread_ts}")
                     if msg_ts and thread_ts:
-                        if msg_ts not in processed_broadcast_timestamps:
-                            thread_broadcast_info[msg_ts] = {
-                                "thread_ts": thread_ts,
-                                "should_broadcast": True,
-                                "original_message": message  # Store the original for conversion
-                            }
-                            processed_broadcast_timestamps.add(msg_ts)
-                            thread_broadcast_count += 1
-                            logger.debug(f"Added to thread_broadcast_info: {msg_ts} -> {thread_ts}")
-                        else:
-                            logger.debug(f"Duplicate thread_broadcast message found for {msg_ts}, ignoring")
+                        broadcast_ts.add(msg_ts)
 
-            if thread_broadcast_count > 0:
-                logger.info(f"Found {thread_broadcast_count} unique thread broadcast messages in #{channel_name}")
-                logger.debug(f"Thread broadcast info keys: {list(thread_broadcast_info.keys())}")
+            if broadcast_ts:
+                logger.info(f"Found {len(broadcast_ts)} unique thread broadcast messages in #{channel_name}")
 
             # Filter and enhance messages
             filtered_messages = []
+            converted_ts = set()
             for message in messages:
                 msg_ts = message.get("ts")
                 is_thread_broadcast = message.get("subtype") == "thread_broadcast"
 
                 if is_thread_broadcast:
                     # Only keep the first occurrence of each thread_broadcast message
-                    if msg_ts in thread_broadcast_info and message is thread_broadcast_info[msg_ts]["original_message"]:
-                        # Convert this thread_broadcast message to a proper thread reply
-                        enhanced_message = message.copy()
-                        enhanced_message.pop("subtype", None)  # Remove thread_broadcast subtype
-                        enhanced_message.pop("root", None)     # Remove root field (not needed)
-                        enhanced_message["thread_ts"] = thread_broadcast_info[msg_ts]["thread_ts"]
-                        enhanced_message["_should_broadcast"] = True
+                    if msg_ts in broadcast_ts and msg_ts not in converted_ts:
+                        converted_ts.add(msg_ts)
+                        # Convert this thread_broadcast message to a proper thread reply. The messages
+                        # were loaded for this upload, so they are changed in place rather than copied.
+                        del message["subtype"]       # Remove thread_broadcast subtype
+                        message.pop("root", None)    # Remove root field (not needed)
+                        message["_should_broadcast"] = True
                         logger.info(f"Converting thread_broadcast message {msg_ts} to thread reply with broadcast")
-                        filtered_messages.append(enhanced_message)
+                        filtered_messages.append(message)
                     else:
                         logger.debug(f"Skipping duplicate thread_broadcast message for ts: {msg_ts}")
                 else:
                     # Regular message - check if it needs enhancement
                     logger.debug(f"Processing regular message: ts={msg_ts}, text='{message.get('text', '')[:50]}...'")
-                    if msg_ts in thread_broadcast_info:
+                    if msg_ts in broadcast_ts:
                         # This should not happen since we only process thread_broadcast messages above
                         logger.warning(f"Unexpected: Regular message {msg_ts} matches thread_broadcast timestamp")
                     filtered_messages.append(message)
 
             # Count files to upload
-            total_files = sum(len(msg.get("files", [])) for msg in filtered_messages)
+            total_files = count_message_files(filtered_messages)
             logger.info(f"Uploading {len(filtered_messages)} messages and {total_files} files to #{channel_name}")
 
             # Sort messages by timestamp (oldest first) to maintain chronological order
@@ -1529,16 +1969,21 @@ class SlackMigrator:
                 all_messages = channel_data.get("messages", [])
                 missing_parents = []
 
+                # Index both lists by timestamp once instead of scanning them per parent
+                filtered_by_ts = {msg.get("ts"): msg for msg in filtered_messages}
+                all_by_ts = {}
+                for msg in all_messages:
+                    if msg.get("subtype") != "thread_broadcast":
+                        all_by_ts.setdefault(msg.get("ts"), msg)
+
                 for parent_ts in thread_parents_needed:
                     # Check if parent is already in our message list
-                    parent_exists = any(msg.get("ts") == parent_ts for msg in filtered_messages)
-                    if not parent_exists:
+                    if parent_ts not in filtered_by_ts:
                         # Find the parent message in the full message list
-                        for msg in all_messages:
-                            if msg.get("ts") == parent_ts and msg.get("subtype") != "thread_broadcast":
-                                missing_parents.append(msg)
-                                logger.info(f"Including thread parent message for complete thread structure")
-                                break
+                        parent = all_by_ts.get(parent_ts)
+                        if parent is not None:
+                            missing_parents.append(parent)
+                            logger.info(f"Including thread parent message for complete thread structure")
 
                 # Add missing parents and re-sort
                 if missing_parents:
@@ -1546,33 +1991,44 @@ class SlackMigrator:
                     filtered_messages.sort(key=lambda m: float(m.get("ts", 0)))
                     logger.info(f"Added {len(missing_parents)} thread parent messages for complete threads")
 
-            # Process messages in chronological order - each message completely before moving to next
-            for message in tqdm(filtered_messages, desc=f"Uploading to #{channel_name}"):
-                try:
-                    posted_ts = self._upload_single_message_with_files(
-                        dest_channel_id, message, users_data, channel_name, thread_mapping
-                    )
+            # Process messages in chronological order - each message is posted before moving to the next.
+            # Reactions do not affect ordering, so they are added in the background meanwhile
+            # (leaving the block waits for them). A message's files are uploaded in parallel.
+            with ThreadPoolExecutor(max_workers=4, thread_name_prefix="reactions") as reaction_executor, \
+                    ThreadPoolExecutor(max_workers=8, thread_name_prefix="file-uploads") as upload_executor:
+                for message in tqdm(filtered_messages, desc=f"Uploading to #{channel_name}"):
+                    try:
+                        posted_ts = self._upload_single_message_with_files(
+                            dest_channel_id, message, users_by_id, channel_name, thread_mapping,
+                            reaction_executor, upload_executor
+                        )
 
-                    # Store the mapping for any message that could be a thread parent
-                    # This includes both regular messages and thread parent messages (where thread_ts == ts)
-                    if posted_ts:
-                        source_ts = message.get("ts")
-                        if source_ts:
-                            thread_mapping[source_ts] = posted_ts
-                            # Debug logging for thread parent detection
-                            thread_ts = message.get("thread_ts")
-                            if thread_ts and thread_ts == source_ts:
-                                logger.debug(f"Mapped thread parent {source_ts} -> {posted_ts}")
+                        # Store the mapping for any message that could be a thread parent
+                        # This includes both regular messages and thread parent messages (where thread_ts == ts)
+                        if posted_ts:
+                            source_ts = message.get("ts")
+                            if source_ts:
+                                thread_mapping[source_ts] = posted_ts
+                                # Debug logging for thread parent detection
+                                thread_ts = message.get("thread_ts")
+                                if thread_ts and thread_ts == source_ts:
+                                    logger.debug(f"Mapped thread parent {source_ts} -> {posted_ts}")
 
-                except Exception as e:
-                    logger.error(f"Failed to upload message: {e}")
+                    except Exception as e:
+                        logger.error(f"Failed to upload message: {e}")
 
             logger.info(f"Completed upload to #{channel_name}")
 
     def _upload_single_message_with_files(self, channel_id: str, message: Dict[str, Any],
-                                         users_data: List[Dict[str, Any]], channel_name: str,
-                                         thread_mapping: Dict[str, str]) -> Optional[str]:
-        """Upload a single message with its files using permalink approach"""
+                                         users_by_id: Dict[str, Dict[str, Any]], channel_name: str,
+                                         thread_mapping: Dict[str, str],
+                                         reaction_executor: Optional[ThreadPoolExecutor] = None,
+                                         upload_executor: Optional[ThreadPoolExecutor] = None) -> Optional[str]:
+        """Upload a single message with its files using permalink approach
+
+        If reaction_executor is given, reactions are added on it instead of before returning.
+        If upload_executor is given, a message's files are uploaded on it in parallel.
+        """
         # Skip if message has no text or is a system message
         text = message.get("text", "")
         if not text or message.get("subtype") in ["channel_join", "channel_leave"]:
@@ -1613,7 +2069,7 @@ class SlackMigrator:
 
         # Get original user info
         source_user_id = message.get("user")
-        user_info = self._get_user_display_info(source_user_id, users_data) if source_user_id else {
+        user_info = self._get_user_display_info(source_user_id, users_by_id) if source_user_id else {
             "display_name": "Unknown User",
             "icon_url": None,
             "real_name": ""
@@ -1633,16 +2089,27 @@ class SlackMigrator:
         # Step 1: Upload files without channel parameter to get permalinks
         file_permalinks = []
         if "files" in message and message["files"]:
+            upload_paths = []
+            upload_infos = []
             for file_info in message["files"]:
                 local_path = file_info.get("local_path")
                 if local_path and file_info.get("download_status") == "success":
                     if Path(local_path).exists():
-                        # Upload file without channel to get permalink
-                        permalink = self._upload_file_for_permalink(local_path, file_info)
-                        if permalink:
-                            file_title = file_info.get("title") or file_info.get("name", "File")
-                            file_permalinks.append(f"<{permalink}|{file_title}>")
-                            logger.info(f"Got permalink for file {file_info.get('name', 'unknown')}")
+                        upload_paths.append(local_path)
+                        upload_infos.append(file_info)
+
+            # Upload files without channel to get permalinks; several files are uploaded
+            # in parallel, and map() keeps the permalinks in the original file order
+            if upload_executor is not None and len(upload_paths) > 1:
+                permalinks = upload_executor.map(self._upload_file_for_permalink, upload_paths, upload_infos)
+            else:
+                permalinks = map(self._upload_file_for_permalink, upload_paths, upload_infos)
+
+            for file_info, permalink in zip(upload_infos, permalinks):
+                if permalink:
+                    file_title = file_info.get("title") or file_info.get("name", "File")
+                    file_permalinks.append(f"<{permalink}|{file_title}>")
+                    logger.info(f"Got permalink for file {file_info.get('name', 'unknown')}")
 
         # Step 2: Compose message with file permalinks
         if file_permalinks:
@@ -1662,13 +2129,13 @@ class SlackMigrator:
                 reply_broadcast=should_broadcast_reply  # Enable broadcast for original thread broadcast messages
             )
 
-            # Add small delay between messages to avoid rate limits
-            time.sleep(0.5)
-
             # Add reactions if present in original message
             if response.get("ok") and response.get("ts"):
                 posted_ts = response["ts"]
-                self._add_message_reactions(channel_id, posted_ts, message, channel_name)
+                if reaction_executor is not None and message.get("reactions"):
+                    reaction_executor.submit(self._add_message_reactions, channel_id, posted_ts, message, channel_name)
+                else:
+                    self._add_message_reactions(channel_id, posted_ts, message, channel_name)
 
         except Exception as e:
             logger.error(f"Failed to post message: {e}")
@@ -1701,9 +2168,6 @@ class SlackMigrator:
                 logger.debug(f"Added reaction :{emoji_name}: to message")
                 successful_reactions += 1
 
-                # Small delay between reactions to avoid rate limits
-                time.sleep(0.2)
-
             except Exception as e:
                 error_str = str(e).lower()
 
@@ -1841,17 +2305,11 @@ class SlackMigrator:
 
         # Get all channels to find the target channel
         try:
-            all_channels = self.source_client.get_channels()
+            target_channel = self.source_client.channels_by_name.get(channel_name)
         except Exception as e:
             logger.error(f"Failed to get channels list: {e}")
             return
 
-        target_channel = None
-        for channel in all_channels:
-            if channel.get("name") == channel_name:
-                target_channel = channel
-                break
-
         if not target_channel:
             logger.error(f"❌ Channel #{channel_name} not found")
             return
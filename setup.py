@@ -14,7 +14,7 @@ setup(
     description="A tool to migrate data between Slack workspaces",
     long_description=long_description,
     long_description_content_type="text/markdown",
-    py_modules=["main", "config", "slack_client", "migrator"],
+    py_modules=["main", "config", "slack_client", "migrator", "storage"],
     python_requires=">=3.8",
     install_requires=requirements,
     entry_points={
@@ -1,5 +1,7 @@
 import time
 import logging
+import threading
+from functools import cached_property
 from typing import List, Dict, Any, Optional, Callable
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
@@ -21,28 +23,86 @@ API_RATE_LIMITS = {
     "conversations_create": 3.0,   # Tier 2 (20+/min)
     "conversations_invite": 3.0,   # Tier 2 (20+/min)
     "chat_postMessage": 1.0,       # Special tier (1/sec per channel)
+    "reactions_add": 1.2,          # Tier 3 (50+/min)
+    # files_upload_v2 is the SDK's wrapper around the two methods below
+    "files_upload_v2": 0.6,               # Tier 4 (100+/min)
+    "files_getUploadURLExternal": 0.6,    # Tier 4 (100+/min)
+    "files_completeUploadExternal": 0.6,  # Tier 4 (100+/min)
 }
 
+# Calls a method may make back to back before being spaced out by its delay
+# (methods not listed get no burst). Matches the number of parallel file uploads.
+API_BURST_LIMITS = {
+    "files_upload_v2": 8,
+    "files_getUploadURLExternal": 8,
+    "files_completeUploadExternal": 8,
+}
+
+class TokenBucket:
+    """Thread-safe token bucket: allows bursts up to capacity, refilled at refill_rate tokens/sec"""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: float = 1):
+        """Take n tokens, sleeping until they are available"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+            self.last_refill = now
+            # Reserve the tokens up front (the balance may go negative) so waiters queue
+            # up behind each other and the sleep itself happens outside the lock
+            self.tokens -= n
+            wait = -self.tokens / self.refill_rate if self.tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hand out no tokens for the next seconds (e.g. after a Retry-After response)"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+            self.last_refill = now
+            self.tokens = min(self.tokens, -seconds * self.refill_rate)
+
 class SlackClient:
     """Wrapper for Slack WebClient with error handling and rate limiting"""
 
-    def __init__(self, token: str, rate_limit_delay: float = 1.0, max_retries: int = 3):
+    def __init__(self, token: str, rate_limit_delay: float = 1.0, max_retries: int = 3,
+                 file_rate_per_sec: float = 1.0, file_burst: int = 1):
         self.client = WebClient(token=token)
         self.base_rate_limit_delay = rate_limit_delay
         self.max_retries = max_retries
+        # File downloads hit the Slack file CDN, which is limited separately from the Web API
+        self.file_bucket = TokenBucket(file_burst, file_rate_per_sec)
+        # One bucket per API method, shared by every thread using this client
+        self._method_buckets: Dict[str, TokenBucket] = {}
 
     def _get_method_delay(self, method: str) -> float:
         """Get the appropriate delay for a specific API method"""
         return API_RATE_LIMITS.get(method, self.base_rate_limit_delay)
 
+    def _wait_for_method(self, method: str):
+        """Space out calls to an API method by its delay, across all threads"""
+        bucket = self._method_buckets.get(method)
+        if bucket is None:
+            method_delay = self._get_method_delay(method)
+            if method_delay <= 0:
+                return
+            bucket = self._method_buckets.setdefault(method, TokenBucket(API_BURST_LIMITS.get(method, 1), 1 / method_delay))
+        bucket.acquire()
+
     def _make_request(self, method: str, **kwargs) -> Dict[str, Any]:
         """Make API request with retry logic and rate limiting"""
-        method_delay = self._get_method_delay(method)
-
         for attempt in range(self.max_retries):
             try:
                 # Apply method-specific rate limiting
-                time.sleep(method_delay)
+                self._wait_for_method(method)
                 response = getattr(self.client, method)(**kwargs)
                 return response.data
             except SlackApiError as e:
@@ -50,9 +110,15 @@ class SlackClient:
 
                 if error_code in ["rate_limited", "ratelimited"]:
                     # Get the retry-after header or use a default long delay
-                    retry_after = int(e.response.get("headers", {}).get("Retry-After", 60))
+                    retry_after = int(e.response.headers.get("Retry-After", 60))
                     logger.warning(f"Rate limited on {method}, waiting {retry_after} seconds...")
-                    time.sleep(retry_after)
+                    bucket = self._method_buckets.get(method)
+                    if bucket is not None:
+                        # Hold back every thread calling this method, not just this one;
+                        # the retry below then waits on the bucket
+                        bucket.pause(retry_after)
+                    else:
+                        time.sleep(retry_after)
                     continue
                 elif method == "reactions_add" and error_code in ["invalid_name", "no_reaction"]:
                     # Don't retry for emoji validation errors - they won't be resolved by retrying
@@ -111,6 +177,11 @@ class SlackClient:
 
         return channels
 
+    @cached_property
+    def channels_by_name(self) -> Dict[str, Dict[str, Any]]:
+        """All channels (including archived ones) keyed by name, fetched once per client"""
+        return {channel["name"]: channel for channel in self.get_channels() if "name" in channel}
+
     def _get_channels_by_type(self, types: str, exclude_archived: bool) -> List[Dict[str, Any]]:
         """Helper method to get channels by specific types"""
         channels = []
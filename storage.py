@@ -0,0 +1,135 @@
+# Helpers for the downloaded data files. Kept free of Slack client imports so that
+# commands which only inspect local data (such as `status`) start quickly.
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; channel files are then loaded whole
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+def load_json(file_path) -> Any:
+    """Load a JSON file, using orjson's faster parser when it is installed"""
+    if orjson is not None:
+        return orjson.loads(Path(file_path).read_bytes())
+    with open(file_path, "r") as f:
+        return json.load(f)
+
+def dump_json(file_path, data: Any, fsync: bool = False):
+    """Write data as indented JSON, using orjson's faster serializer when it is installed
+
+    The data is written to a temporary file that then replaces file_path, so an
+    interrupted write never leaves a truncated file behind. Pass fsync=True to also
+    flush it to disk before the rename (for data that is expensive to re-download).
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+
+    file_path = Path(file_path)
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def append_json_lines(file_path, items: List[Any]):
+    """Append items to a JSON Lines file, one compact JSON document per line"""
+    if orjson is not None:
+        lines = b"".join([orjson.dumps(item) + b"\n" for item in items])
+    else:
+        lines = "".join([json.dumps(item) + "\n" for item in items]).encode("utf-8")
+    with open(file_path, "a+b") as f:
+        # An interrupted write can leave a line without its newline; start a fresh
+        # line so the torn one doesn't swallow the first new item
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                lines = b"\n" + lines
+        f.write(lines)
+
+def load_json_lines(file_path) -> List[Any]:
+    """Load a JSON Lines file, skipping a line that was cut short by an interrupted write"""
+    loads = orjson.loads if orjson is not None else json.loads
+    items = []
+    with open(file_path, "rb") as f:
+        for line in f:
+            try:
+                items.append(loads(line))
+            except ValueError:
+                logger.warning(f"Skipping unreadable line in {file_path}")
+    return items
+
+def iter_message_file_infos(file_path) -> Iterator[Dict[str, Any]]:
+    """Yield the file entries of every message in a channel file, streaming it when ijson is installed"""
+    if ijson is None:
+        for message in load_json(file_path).get("messages", []):
+            yield from message.get("files", [])
+        return
+    with open(file_path, "rb") as f:
+        yield from ijson.items(f, "messages.item.files.item", use_float=True)
+
+def iter_message_timestamps(file_path) -> Iterator[str]:
+    """Yield the ts of every message in a channel file, streaming it when ijson is installed"""
+    if ijson is None:
+        for message in load_json(file_path).get("messages", []):
+            if "ts" in message:
+                yield message["ts"]
+        return
+    with open(file_path, "rb") as f:
+        yield from ijson.items(f, "messages.item.ts")
+
+def count_message_files(messages: List[Dict[str, Any]]) -> int:
+    """Count the file attachments across a list of messages"""
+    # Most messages have no files, so skip them without a call to len()
+    return sum([len(msg["files"]) for msg in messages if "files" in msg])
+
+# Per-channel message/file counts, kept next to (not inside) the messages directory
+MESSAGE_SUMMARY_FILE = "message_summary.json"
+
+def load_message_summary(output_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Load the message summary, keyed by channel file name (empty if missing or unreadable)"""
+    try:
+        summary = load_json(Path(output_dir) / MESSAGE_SUMMARY_FILE)
+        return summary if isinstance(summary, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_message_summary(output_dir: Path, summary: Dict[str, Dict[str, Any]]):
+    """Save the message summary; failures are logged, since it can always be rebuilt"""
+    try:
+        dump_json(Path(output_dir) / MESSAGE_SUMMARY_FILE, summary)
+    except OSError as e:
+        logger.warning(f"Could not save message summary: {e}")
+
+def message_summary_entry(file_path: Path, message_count: int, file_count: int, has_error: bool,
+                          stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+    """Build a summary entry, stamped with the channel file's mtime and size to detect stale entries"""
+    # Callers that counted the file pass the stat they took first, so a concurrent
+    # rewrite can't pair the new mtime with the old counts
+    if stat is None:
+        stat = file_path.stat()
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "messages": message_count,
+        "files": file_count,
+        "error": has_error
+    }
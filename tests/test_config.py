@@ -0,0 +1,31 @@
+import pytest
+
+from config import SlackConfig
+
+TOKENS = {"SOURCE_SLACK_TOKEN": "xoxb-source", "DEST_SLACK_TOKEN": "xoxb-dest"}
+
+def test_from_env_defaults():
+    config = SlackConfig.from_env(TOKENS)
+    assert config.source_token == "xoxb-source"
+    assert config.dest_token == "xoxb-dest"
+    assert config.batch_size == 100
+    assert config.rate_limit_delay == 1.0
+
+def test_from_env_converts_values():
+    config = SlackConfig.from_env({**TOKENS, "BATCH_SIZE": "50", "RATE_LIMIT_DELAY": "0.5"})
+    assert config.batch_size == 50
+    assert config.rate_limit_delay == 0.5
+
+def test_from_env_reports_all_errors_at_once():
+    with pytest.raises(ValueError) as exc_info:
+        SlackConfig.from_env({"DEST_SLACK_TOKEN": "", "BATCH_SIZE": "lots", "MAX_RETRIES": "3.5"})
+    message = str(exc_info.value)
+    assert "SOURCE_SLACK_TOKEN environment variable is required" in message
+    assert "DEST_SLACK_TOKEN environment variable is required" in message
+    assert "BATCH_SIZE='lots' is not a valid int" in message
+    assert "MAX_RETRIES='3.5' is not a valid int" in message
+
+def test_from_env_without_tokens():
+    config = SlackConfig.from_env({}, require_tokens=False)
+    assert config.source_token == ""
+    assert config.dest_token == ""
@@ -0,0 +1,26 @@
+import json
+
+import main
+from main import index_channel_files, count_channel_messages
+
+def test_index_channel_files(tmp_path):
+    for name in ("general_C01234567.json", "team_updates_C0ABCDEF12.json", "random_notes.json",
+                 "solo.json", "general_C01234567.messages.jsonl", "notes.txt"):
+        (tmp_path / name).write_text("{}")
+    (tmp_path / "dir_C01234567.json").mkdir()
+
+    assert index_channel_files(tmp_path) == {
+        "general": tmp_path / "general_C01234567.json",
+        "team_updates": tmp_path / "team_updates_C0ABCDEF12.json",
+        "random": tmp_path / "random_notes.json",
+        "solo": tmp_path / "solo.json",
+    }
+
+def test_count_channel_messages_matches_without_ijson(tmp_path, monkeypatch):
+    path = tmp_path / "general_C01234567.json"
+    for error in (None, "", "channel_not_found", {}, {"code": 1}, [], ["x"]):
+        path.write_text(json.dumps({"messages": [{"ts": "1.0", "files": [{}, {}]}, {"ts": "2.0"}], "error": error}))
+        streamed = count_channel_messages(path)
+        with monkeypatch.context() as patch:
+            patch.setattr(main, "ijson", None)
+            assert count_channel_messages(path) == streamed == (2, 2, bool(error))
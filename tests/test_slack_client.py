@@ -0,0 +1,52 @@
+import pytest
+
+import slack_client
+from slack_client import TokenBucket
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep so the bucket can be tested without waiting"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(slack_client.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(slack_client.time, "sleep", fake.sleep)
+    return fake
+
+def test_burst_up_to_capacity_without_waiting(clock):
+    bucket = TokenBucket(capacity=3, refill_rate=1.0)
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+def test_waits_for_refill_once_empty(clock):
+    bucket = TokenBucket(capacity=2, refill_rate=4.0)
+    for _ in range(4):
+        bucket.acquire()
+    assert clock.sleeps == pytest.approx([0.25, 0.25])
+
+def test_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(capacity=2, refill_rate=1.0)
+    bucket.acquire(2)
+    clock.now += 100
+    bucket.acquire(2)
+    bucket.acquire()
+    assert clock.sleeps == pytest.approx([1.0])
+
+def test_pause_blocks_until_retry_after(clock):
+    bucket = TokenBucket(capacity=5, refill_rate=2.0)
+    bucket.pause(3)
+    bucket.acquire()
+    # Three seconds of pause plus half a second to earn the token itself
+    assert clock.sleeps == pytest.approx([3.5])
@@ -0,0 +1,108 @@
+import json
+
+import pytest
+
+import storage
+from storage import (
+    dump_json, load_json, append_json_lines, load_json_lines, iter_message_file_infos,
+    iter_message_timestamps, count_message_files, load_message_summary, save_message_summary,
+    message_summary_entry, MESSAGE_SUMMARY_FILE
+)
+
+CHANNEL = {
+    "channel_info": {"id": "C01234567", "name": "general"},
+    "messages": [
+        {"ts": "1.0", "files": [{"id": "F1"}, {"id": "F2"}]},
+        {"ts": "2.0"},
+        {"text": "no ts", "files": [{"id": "F3"}]},
+    ]
+}
+
+@pytest.fixture(params=["fast", "stdlib"])
+def parsers(request, monkeypatch):
+    """Run each test with and without the optional orjson/ijson parsers"""
+    if request.param == "stdlib":
+        monkeypatch.setattr(storage, "orjson", None)
+        monkeypatch.setattr(storage, "ijson", None)
+
+def test_dump_json_round_trip(tmp_path, parsers):
+    path = tmp_path / "data.json"
+    dump_json(path, CHANNEL, fsync=True)
+    assert load_json(path) == CHANNEL
+    assert json.loads(path.read_text()) == CHANNEL
+    assert not (tmp_path / "data.json.tmp").exists()
+
+def test_dump_json_failure_keeps_previous_file(tmp_path, parsers):
+    path = tmp_path / "data.json"
+    dump_json(path, {"old": True})
+    with pytest.raises(TypeError):
+        dump_json(path, {"new": object()})
+    assert load_json(path) == {"old": True}
+    assert list(tmp_path.iterdir()) == [path]
+
+def test_dump_json_interrupted_replace_keeps_previous_file(tmp_path, monkeypatch, parsers):
+    path = tmp_path / "data.json"
+    dump_json(path, {"old": True})
+
+    def interrupted_replace(src, dst):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(storage.os, "replace", interrupted_replace)
+
+    with pytest.raises(KeyboardInterrupt):
+        dump_json(path, {"new": True})
+    assert load_json(path) == {"old": True}
+    assert not (tmp_path / "data.json.tmp").exists()
+
+def test_json_lines_append_and_load(tmp_path, parsers):
+    path = tmp_path / "messages.jsonl"
+    append_json_lines(path, CHANNEL["messages"][:2])
+    append_json_lines(path, CHANNEL["messages"][2:])
+    assert load_json_lines(path) == CHANNEL["messages"]
+
+def test_load_json_lines_skips_torn_last_line(tmp_path, parsers):
+    path = tmp_path / "messages.jsonl"
+    append_json_lines(path, [{"ts": "1.0"}, {"ts": "2.0"}])
+    with open(path, "ab") as f:
+        f.write(b'{"ts": "3.')
+    assert load_json_lines(path) == [{"ts": "1.0"}, {"ts": "2.0"}]
+
+def test_resumed_append_after_torn_line(tmp_path, parsers):
+    path = tmp_path / "messages.jsonl"
+    path.write_bytes(b'{"ts": "1.0"}\n{"ts": "2.')
+    append_json_lines(path, [{"ts": "3.0"}])
+    assert load_json_lines(path) == [{"ts": "1.0"}, {"ts": "3.0"}]
+
+def test_iterators_stream_channel_file(tmp_path, parsers):
+    path = tmp_path / "general_C01234567.json"
+    dump_json(path, CHANNEL)
+    assert [info["id"] for info in iter_message_file_infos(path)] == ["F1", "F2", "F3"]
+    assert list(iter_message_timestamps(path)) == ["1.0", "2.0"]
+
+def test_count_message_files():
+    assert count_message_files(CHANNEL["messages"]) == 3
+    assert count_message_files([]) == 0
+
+def test_message_summary_round_trip(tmp_path, parsers):
+    channel_file = tmp_path / "general_C01234567.json"
+    dump_json(channel_file, CHANNEL)
+    entry = message_summary_entry(channel_file, 3, 3, False)
+    stat = channel_file.stat()
+    assert entry == {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "messages": 3, "files": 3, "error": False}
+
+    save_message_summary(tmp_path, {channel_file.name: entry})
+    assert load_message_summary(tmp_path) == {channel_file.name: entry}
+
+def test_message_summary_entry_uses_given_stat(tmp_path):
+    channel_file = tmp_path / "general_C01234567.json"
+    channel_file.write_text("{}")
+    stat = channel_file.stat()
+    channel_file.write_text('{"messages": []}')
+    entry = message_summary_entry(channel_file, 0, 0, False, stat=stat)
+    assert entry["size"] == stat.st_size == 2
+
+def test_load_message_summary_missing_or_corrupt(tmp_path):
+    assert load_message_summary(tmp_path) == {}
+    (tmp_path / MESSAGE_SUMMARY_FILE).write_text("[1, 2")
+    assert load_message_summary(tmp_path) == {}
+    (tmp_path / MESSAGE_SUMMARY_FILE).write_text("[1, 2]")
+    assert load_message_summary(tmp_path) == {}